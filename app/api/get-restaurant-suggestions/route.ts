@@ -1,14 +1,14 @@
 import { NextRequest, NextResponse } from "next/server";
 import { sessionStore, WORKFLOW_STATES } from "@/lib/services/session-store";
 import { getPlacesClient } from "@/lib/services/places-client";
-import type { PlaceResult } from "@/lib/services/places-client";
 import type { RestaurantSuggestion, Coordinates } from "@/lib/models/travel-plan";
 import { getPriceRangeSymbol } from "@/lib/utils/currency";
 import {
   buildRestaurantQueries,
 } from "@/lib/services/restaurant-dietary";
+import { getCentroid, searchRestaurantsWithFallbacks, takeUniquePlaces } from "@/lib/services/restaurant-search";
 
-const RESTAURANT_TYPE_TOKENS = [
+const RESTAURANT_TYPE_TOKENS = new Set([
   "italian_restaurant",
   "chinese_restaurant",
   "mexican_restaurant",
@@ -21,61 +21,7 @@ const RESTAURANT_TYPE_TOKENS = [
   "vietnamese_restaurant",
   "korean_restaurant",
   "greek_restaurant",
-];
-
-/**
- * Get centroid of coordinates
- */
-function getCentroid(coordinates: Coordinates[]): Coordinates {
-  if (coordinates.length === 0) {
-    return { lat: 0, lng: 0 };
-  }
-  const sum = coordinates.reduce(
-    (acc, coord) => ({ lat: acc.lat + coord.lat, lng: acc.lng + coord.lng }),
-    { lat: 0, lng: 0 }
-  );
-  return {
-    lat: sum.lat / coordinates.length,
-    lng: sum.lng / coordinates.length,
-  };
-}
-
-function dedupePlacesById<T extends { place_id: string }>(places: T[]): T[] {
-  const byId = new Map<string, T>();
-  for (const place of places) {
-    if (!byId.has(place.place_id)) {
-      byId.set(place.place_id, place);
-    }
-  }
-  return Array.from(byId.values());
-}
-
-async function searchRestaurantsWithFallbacks(
-  query: string,
-  allCoordinates: Coordinates[],
-  centroid: Coordinates,
-  destination: string | null,
-  placesClient: ReturnType<typeof getPlacesClient>,
-): Promise<PlaceResult[]> {
-  let places = await placesClient.searchPlaces(query, centroid, 3000, "restaurant");
-
-  if (places.length === 0) {
-    places = await placesClient.searchPlaces(query, centroid, 12000, "restaurant");
-  }
-
-  if (places.length === 0) {
-    const perActivityResults = await Promise.all(
-      allCoordinates.slice(0, 8).map((coord) => placesClient.searchPlaces(query, coord, 6000, "restaurant"))
-    );
-    places = dedupePlacesById(perActivityResults.flat());
-  }
-
-  if (places.length === 0 && destination) {
-    places = await placesClient.searchPlaces(`${query} in ${destination}`, null, 5000, "restaurant");
-  }
-
-  return places;
-}
+]);
 
 /**
  * Get currency from session activities
@@ -175,10 +121,12 @@ export async function POST(request: NextRequest) {
         searchRestaurantsWithFallbacks(query, allCoordinates, centroid, session.tripInfo.destination, placesClient)
       )
     );
-    const places = dedupePlacesById(placeGroups.flat());
+    const places = takeUniquePlaces(placeGroups, 10);
 
     const restaurants: RestaurantSuggestion[] = await Promise.all(
-      places.slice(0, 10).map(async (place, index) => {
+      places.map(async (place, index) => {
+        const cuisine =
+          place.types.find((t) => RESTAURANT_TYPE_TOKENS.has(t))?.replace("_restaurant", "").replace("_", " ") || null;
         try {
           const details = place.place_id ? await placesClient.getPlaceDetails(place.place_id) : null;
           const photoUrls =
@@ -189,9 +137,7 @@ export async function POST(request: NextRequest) {
           return {
             id: `rest${index + 1}`,
             name: place.name,
-            cuisine:
-              place.types.find((t) => RESTAURANT_TYPE_TOKENS.includes(t))?.replace("_restaurant", "").replace("_", " ") ||
-              null,
+            cuisine,
             rating: details?.rating ?? place.rating ?? null,
             user_ratings_total: details?.user_ratings_total ?? null,
             priceRange: getPriceRangeSymbol(details?.price_level ?? place.price_level, currency),
@@ -209,9 +155,7 @@ export async function POST(request: NextRequest) {
           return {
             id: `rest${index + 1}`,
             name: place.name,
-            cuisine:
-              place.types.find((t) => RESTAURANT_TYPE_TOKENS.includes(t))?.replace("_restaurant", "").replace("_", " ") ||
-              null,
+            cuisine,
             rating: place.rating || null,
             user_ratings_total: null,
             priceRange: getPriceRangeSymbol(place.price_level, currency),
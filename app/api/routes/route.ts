@@ -32,9 +32,11 @@ function isValidCoordinate(value: Coordinates | null | undefined): value is Coor
   );
 }
 
+const ROUTE_DURATION_PATTERN = /^\s*([\d.]+)s\s*$/;
+
 function parseDurationSeconds(duration?: string): number | null {
   if (!duration) return null;
-  const match = duration.match(/^\s*([\d.]+)s\s*$/);
+  const match = ROUTE_DURATION_PATTERN.exec(duration);
   if (!match) return null;
   const seconds = Number.parseFloat(match[1]);
   if (!Number.isFinite(seconds)) return null;
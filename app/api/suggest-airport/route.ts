@@ -52,8 +52,15 @@ export async function POST(request: NextRequest) {
         queries.map((query) => placesClient.searchPlaces(query, null, 12000, "airport", { preferTextSearch: true })),
       );
 
-      const top = dedupeByPlaceId(batches.flat())
-        .sort((a, b) => airportScore(b) - airportScore(a))[0];
+      let top: (typeof batches)[number][number] | undefined;
+      let topScore = Number.NEGATIVE_INFINITY;
+      for (const place of dedupeByPlaceId(batches.flat())) {
+        const score = airportScore(place);
+        if (score > topScore) {
+          top = place;
+          topScore = score;
+        }
+      }
 
       return NextResponse.json({
         success: true,
@@ -1938,7 +1938,12 @@ export default function PlannerPage() {
     }
   };
 
-  const activeTimelineLocations = timelineAnalysis?.mapPoints?.[activeTimelineView] || [];
+  const activeTimelineLocations = timelineAnalysis?.mapPoints?.[activeTimelineView];
+  // Stable prop identities let MapComponent's memoized marker data survive unrelated page re-renders.
+  const mapResearchOptionSelections = useMemo(
+    () => Object.fromEntries(selectedResearchOptionIds.map((id) => [id, "selected" as const])),
+    [selectedResearchOptionIds]
+  );
   const isFinalized = workflowState === WORKFLOW_STATES.FINALIZE;
   const selectedActivitiesForGrouping = useMemo(
     () => suggestedActivities.filter((activity) => selectedActivityIds.includes(activity.id)),
@@ -2778,9 +2783,7 @@ export default function PlannerPage() {
               <MapComponent
                 destination={tripInfo?.destination}
                 tripResearchBrief={tripResearchBrief}
-                researchOptionSelections={Object.fromEntries(
-                  selectedResearchOptionIds.map((id) => [id, "selected" as const])
-                )}
+                researchOptionSelections={mapResearchOptionSelections}
                 suggestedActivities={
                   workflowState === WORKFLOW_STATES.SUGGEST_ACTIVITIES ||
                     workflowState === WORKFLOW_STATES.SELECT_ACTIVITIES
@@ -2803,7 +2806,7 @@ export default function PlannerPage() {
                 timelineLocations={
                   workflowState === WORKFLOW_STATES.INFO_GATHERING
                     ? activeTimelineLocations
-                    : []
+                    : undefined
                 }
                 timelineLabel={
                   workflowState === WORKFLOW_STATES.INFO_GATHERING && timelineAnalysis
@@ -1,11 +1,18 @@
 "use client";
 
-import { useEffect, useState } from "react";
+import { useEffect, useMemo, useState } from "react";
 import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
 import type { AccommodationOption, SubAgentStatus } from "@/lib/api-client";
 import { Check, ChevronDown, ChevronUp, ExternalLink, Loader2, MapPin, Star, X } from "lucide-react";
 
+const PRICE_FORMATTER = new Intl.NumberFormat();
+
+function formatPrice(option: AccommodationOption): string {
+  if (option.nightlyPriceEstimate == null) return "Price unavailable";
+  return `${option.currency} ${PRICE_FORMATTER.format(option.nightlyPriceEstimate)}/night`;
+}
+
 interface AccommodationSuggestionsViewProps {
   status: SubAgentStatus;
   error: string | null;
@@ -44,10 +51,10 @@ export function AccommodationSuggestionsView({
     setCollapsedCards((prev) => ({ ...prev, [optionId]: !prev[optionId] }));
   };
 
-  const formatPrice = (option: AccommodationOption) => {
-    if (option.nightlyPriceEstimate == null) return "Price unavailable";
-    return `${option.currency} ${option.nightlyPriceEstimate.toLocaleString()}/night`;
-  };
+  const priceLabels = useMemo(
+    () => new Map(options.map((option) => [option.id, formatPrice(option)])),
+    [options]
+  );
 
   return (
     <div className="p-4 space-y-4">
@@ -125,7 +132,7 @@ export function AccommodationSuggestionsView({
                       <Check className="h-4 w-4" />
                     </div>
                   ) : null}
-                  <p className="text-right text-sm font-medium text-gray-700">{formatPrice(option)}</p>
+                  <p className="text-right text-sm font-medium text-gray-700">{priceLabels.get(option.id)}</p>
                   <Button
                     type="button"
                     variant="ghost"
@@ -19,7 +19,7 @@ import type {
   AccommodationOption,
   FlightOption,
 } from "@/lib/api-client";
-import { parseEstimatedHours } from "@/lib/utils/timeline-utils";
+import { earliestMinutes, parseEstimatedHours } from "@/lib/utils/timeline-utils";
 import { computePlannableDurationHours } from "@/lib/planning-flags";
 import { getDayBadgeColors, getDayColor } from "@/lib/constants";
 import { ActivityCard } from "@/components/ActivityCard";
@@ -642,7 +642,7 @@ export function DayItineraryView({
     const a =
       Math.sin(dLat / 2) * Math.sin(dLat / 2) +
       Math.cos(toRad(from.lat)) * Math.cos(toRad(to.lat)) * Math.sin(dLng / 2) * Math.sin(dLng / 2);
-    const c = 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a));
+    const c = 2 * Math.asin(Math.min(1, Math.sqrt(a)));
     return R * c;
   }
 
@@ -847,15 +847,10 @@ export function DayItineraryView({
       0
     );
     const freeActivityHours = Math.max(0, remainingForActivities - totalRequestedHours);
-    const earliestFixedStartMinutes = sortedActivities
-      .filter((activity) => activity.isFixedStartTime)
-      .map((activity) => parseFixedStartTimeMinutes(activity.fixedStartTime))
-      .filter((minutes): minutes is number => minutes != null)
-      .sort((a, b) => a - b)[0];
-    const earliestRecommendedMidpointMinutes = sortedActivities
-      .map((activity) => recommendedWindowMidpointMinutes(activity))
-      .filter((minutes): minutes is number => minutes != null)
-      .sort((a, b) => a - b)[0];
+    const earliestFixedStartMinutes = earliestMinutes(sortedActivities, (activity) =>
+      activity.isFixedStartTime ? parseFixedStartTimeMinutes(activity.fixedStartTime) : null
+    );
+    const earliestRecommendedMidpointMinutes = earliestMinutes(sortedActivities, recommendedWindowMidpointMinutes);
     const hadVeryEarlyFixedStart =
       (earliestFixedStartMinutes != null && earliestFixedStartMinutes <= 6 * 60) ||
       sortedActivities.some((activity) => activity.isFixedStartTime && activity.fixedStartTime?.toLowerCase() === "sunrise");
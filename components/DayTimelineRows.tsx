@@ -23,6 +23,7 @@ import {
   estimateRouteIntrinsicMinutes,
   parseFixedStartTimeMinutes,
   hasHardFixedStart,
+  earliestMinutes,
   recommendedWindowMidpointMinutes,
   nightOnlyStartFloorMinutes,
   getActivityTimingPolicy,
@@ -315,15 +316,10 @@ export function DayTimelineRows({
     return sum + computePlannableDurationHours(recommendedHours, activity.isDurationFlexible);
   }, 0);
   const freeActivityHours = Math.max(0, remainingForActivities - totalRequestedHours);
-  const earliestFixedStartMinutes = sortedActivities
-    .filter((activity) => hasHardFixedStart(activity))
-    .map((activity) => parseFixedStartTimeMinutes(activity.fixedStartTime))
-    .filter((minutes): minutes is number => minutes != null)
-    .sort((a, b) => a - b)[0];
-  const earliestRecommendedMidpointMinutes = sortedActivities
-    .map((activity) => recommendedWindowMidpointMinutes(activity))
-    .filter((minutes): minutes is number => minutes != null)
-    .sort((a, b) => a - b)[0];
+  const earliestFixedStartMinutes = earliestMinutes(sortedActivities, (activity) =>
+    hasHardFixedStart(activity) ? parseFixedStartTimeMinutes(activity.fixedStartTime) : null
+  );
+  const earliestRecommendedMidpointMinutes = earliestMinutes(sortedActivities, recommendedWindowMidpointMinutes);
   const hadVeryEarlyFixedStart =
     (earliestFixedStartMinutes != null && earliestFixedStartMinutes <= 6 * 60) ||
     sortedActivities.some((activity) => activity.isFixedStartTime && activity.fixedStartTime?.toLowerCase() === "sunrise");
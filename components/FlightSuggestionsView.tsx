@@ -1,11 +1,18 @@
 "use client";
 
-import { useEffect, useState } from "react";
+import { useEffect, useMemo, useState } from "react";
 import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
 import type { FlightOption, SubAgentStatus } from "@/lib/api-client";
 import { Check, ChevronDown, ChevronUp, Clock, ExternalLink, Loader2, Plane, Timer, X } from "lucide-react";
 
+const PRICE_FORMATTER = new Intl.NumberFormat();
+
+function formatPrice(option: FlightOption): string {
+  if (option.totalPriceEstimate == null) return "Price unavailable";
+  return `${option.currency} ${PRICE_FORMATTER.format(option.totalPriceEstimate)}`;
+}
+
 interface FlightSuggestionsViewProps {
   status: SubAgentStatus;
   error: string | null;
@@ -44,10 +51,10 @@ export function FlightSuggestionsView({
     setCollapsedCards((prev) => ({ ...prev, [optionId]: !prev[optionId] }));
   };
 
-  const formatPrice = (option: FlightOption) => {
-    if (option.totalPriceEstimate == null) return "Price unavailable";
-    return `${option.currency} ${option.totalPriceEstimate.toLocaleString()}`;
-  };
+  const priceLabels = useMemo(
+    () => new Map(options.map((option) => [option.id, formatPrice(option)])),
+    [options]
+  );
 
   const stopsLabel = (stops: number | null) => {
     if (stops == null) return "Stops N/A";
@@ -129,7 +136,7 @@ export function FlightSuggestionsView({
                       <Check className="h-4 w-4" />
                     </div>
                   ) : null}
-                  <p className="text-right text-sm font-medium text-gray-700">{formatPrice(option)}</p>
+                  <p className="text-right text-sm font-medium text-gray-700">{priceLabels.get(option.id)}</p>
                   <Button
                     type="button"
                     variant="ghost"
@@ -5,10 +5,12 @@ import {
   GoogleMap,
   useJsApiLoader,
   Marker,
+  MarkerClusterer,
   InfoWindow,
   OverlayView,
   Polyline,
 } from "@react-google-maps/api";
+import type { MarkerProps } from "@react-google-maps/api";
 import { computeRoutes, getConfig } from "@/lib/api-client";
 import type {
   SuggestedActivity,
@@ -24,6 +26,45 @@ const containerStyle = {
   height: "100%",
 };
 
+// Timeline maps can carry hundreds of places; past this count markers are clustered so only
+// the visible cluster icons are painted on zoom/pan.
+const TIMELINE_CLUSTER_MIN_LOCATIONS = 60;
+
+const DEFAULT_FIT_BOUNDS_PADDING: google.maps.Padding = { top: 50, right: 50, bottom: 50, left: 50 };
+const TIMELINE_FIT_BOUNDS_PADDING: google.maps.Padding = { top: 56, right: 28, bottom: 92, left: 28 };
+
+const MARKER_PIN_PATH = "M12 0C7.58 0 4 3.58 4 8c0 5.25 8 13 8 13s8-7.75 8-13c0-4.42-3.58-8-8-8z";
+
+// Pin anchor points are identical for every pin marker, so build them once after the
+// Maps API loads and share them instead of allocating two Points per marker per render.
+let pinIconPoints: Pick<google.maps.Symbol, "anchor" | "labelOrigin"> | null = null;
+
+function getPinIconPoints(): Pick<google.maps.Symbol, "anchor" | "labelOrigin"> {
+  if (!pinIconPoints) {
+    pinIconPoints = {
+      anchor: new window.google.maps.Point(12, 21),
+      labelOrigin: new window.google.maps.Point(12, 8),
+    };
+  }
+  return pinIconPoints;
+}
+
+const STAY_ICON_SVG = `
+  <svg xmlns="http://www.w3.org/2000/svg" width="48" height="48" viewBox="0 0 48 48">
+    <g fill="none" stroke="#111827" stroke-width="2.4" stroke-linejoin="round" stroke-linecap="round">
+      <path d="M6 22L24 8l18 14" fill="none"/>
+      <polygon points="24,8 42,22 42,36 6,36 6,22" fill="#F3F4F6"/>
+      <polygon points="24,8 42,22 38,22 24,12 10,22 6,22" fill="#EF4444"/>
+      <rect x="21" y="24" width="6" height="12" rx="1.2" fill="#EF4444"/>
+      <rect x="11" y="24" width="7" height="7" rx="1" fill="#38BDF8"/>
+      <rect x="30" y="24" width="7" height="7" rx="1" fill="#38BDF8"/>
+      <rect x="36" y="14" width="4" height="8" rx="1" fill="#EF4444"/>
+      <path d="M30 36c2.5-4 7-4 9 0" fill="#22C55E" stroke="#16A34A"/>
+    </g>
+  </svg>
+`;
+const STAY_ICON_URL = `data:image/svg+xml;utf8,${encodeURIComponent(STAY_ICON_SVG.trim())}`;
+
 const TIMELINE_MAP_STYLES: google.maps.MapTypeStyle[] = [
   { elementType: "geometry", stylers: [{ color: "#09162a" }] },
   { elementType: "labels.text.fill", stylers: [{ color: "#dbe7ff" }] },
@@ -112,8 +153,9 @@ interface MapComponentProps {
 function formatTimelineDuration(totalMinutes: number): string {
   if (totalMinutes < 60) return `${Math.max(1, Math.round(totalMinutes))} min`;
 
-  const hours = Math.floor(totalMinutes / 60);
-  const minutes = Math.round(totalMinutes % 60);
+  const roundedMinutes = Math.round(totalMinutes);
+  const hours = Math.floor(roundedMinutes / 60);
+  const minutes = roundedMinutes % 60;
   if (hours < 24) {
     return minutes > 0 ? `${hours}h ${minutes}m` : `${hours}h`;
   }
@@ -241,6 +283,28 @@ export default function MapComponent({
 }: MapComponentProps) {
   const [apiKey, setApiKey] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  const [isNearViewport, setIsNearViewport] = useState(false);
+
+  // Defer loading the Maps JS API until the map panel scrolls near the viewport (e.g. stacked
+  // below the workflow panel on small screens).
+  const observeMapContainer = useCallback((element: HTMLDivElement | null) => {
+    if (!element) return;
+    if (typeof IntersectionObserver === "undefined") {
+      setIsNearViewport(true);
+      return;
+    }
+    const observer = new IntersectionObserver(
+      (entries) => {
+        if (entries.some((entry) => entry.isIntersecting)) {
+          setIsNearViewport(true);
+          observer.disconnect();
+        }
+      },
+      { rootMargin: "200px" }
+    );
+    observer.observe(element);
+    return () => observer.disconnect();
+  }, []);
 
   // Fetch API key from backend
   useEffect(() => {
@@ -504,20 +568,22 @@ export default function MapComponent({
     routeSegments.length === 0;
 
   return (
-    <div className="relative h-full w-full min-h-[500px] rounded-xl border border-gray-200 overflow-hidden">
-      <GoogleMapContent
-        apiKey={apiKey}
-        locations={locations}
-        destination={destination}
-        routeSegments={routeSegments}
-        isGroupedMode={isGroupedMode}
-        isResearchSelectionMode={isResearchSelectionMode}
-        isActivitySelectionMode={isActivitySelectionMode}
-        isTimelineMode={isTimelineOnlyMode}
-        onActivityClick={onActivityClick}
-        hoveredActivityId={hoveredActivityId}
-        highlightedDay={highlightedDay}
-      />
+    <div ref={observeMapContainer} className="relative h-full w-full min-h-[500px] rounded-xl border border-gray-200 overflow-hidden">
+      {isNearViewport ? (
+        <GoogleMapContent
+          apiKey={apiKey}
+          locations={locations}
+          destination={destination}
+          routeSegments={routeSegments}
+          isGroupedMode={isGroupedMode}
+          isResearchSelectionMode={isResearchSelectionMode}
+          isActivitySelectionMode={isActivitySelectionMode}
+          isTimelineMode={isTimelineOnlyMode}
+          onActivityClick={onActivityClick}
+          hoveredActivityId={hoveredActivityId}
+          highlightedDay={highlightedDay}
+        />
+      ) : null}
       {isTimelineOnlyMode ? (
         <div className="pointer-events-none absolute bottom-4 left-4 rounded-2xl border border-white/10 bg-slate-950/80 px-4 py-3 text-white shadow-2xl backdrop-blur">
           <p className="text-[11px] font-medium uppercase tracking-[0.24em] text-white/65">
@@ -544,6 +610,38 @@ interface GoogleMapContentProps {
   highlightedDay?: number | null;
 }
 
+function getPathBounds(path: google.maps.LatLngLiteral[]): google.maps.LatLngBoundsLiteral | null {
+  if (path.length === 0) return null;
+  let south = path[0].lat;
+  let north = path[0].lat;
+  let west = path[0].lng;
+  let east = path[0].lng;
+  for (const point of path) {
+    if (point.lat < south) south = point.lat;
+    if (point.lat > north) north = point.lat;
+    if (point.lng < west) west = point.lng;
+    if (point.lng > east) east = point.lng;
+  }
+  return { south, west, north, east };
+}
+
+const DAY_ROUTE_SLOT_ORDER: Record<string, number> = {
+  "stay-start": -1,
+  morning: 0,
+  afternoon: 1,
+  evening: 2,
+  any: 3,
+  restaurant: 3,
+  "stay-end": 4,
+};
+
+function compareDayRouteLocations(a: Location, b: Location): number {
+  const aScore = DAY_ROUTE_SLOT_ORDER[a.slot || "any"] ?? 3;
+  const bScore = DAY_ROUTE_SLOT_ORDER[b.slot || "any"] ?? 3;
+  if (aScore !== bScore) return aScore - bScore;
+  return a.actIndex - b.actIndex;
+}
+
 // Hover tooltip component for showing activity/restaurant info
 function HoverTooltip({ location }: { location: Location }) {
   return (
@@ -601,6 +699,7 @@ function GoogleMapContent({
   const [selectedMarker, setSelectedMarker] = useState<Location | null>(null);
   const [hoveredMarker, setHoveredMarker] = useState<Location | null>(null);
   const [map, setMap] = useState<google.maps.Map | null>(null);
+  const [viewportBounds, setViewportBounds] = useState<google.maps.LatLngBounds | null>(null);
   const [destinationCenter, setDestinationCenter] = useState<Coordinates | null>(null);
   const [routeOverlays, setRouteOverlays] = useState<Record<string, { polyline?: string | null }>>({});
   const [dayRouteOverlays, setDayRouteOverlays] = useState<Record<string, { polyline?: string | null }>>({});
@@ -614,29 +713,6 @@ function GoogleMapContent({
     libraries: ["geometry"],
   });
 
-  const sortLocationsForDay = useCallback(
-    (day: number) => {
-      const score: Record<"stay-start" | "morning" | "afternoon" | "evening" | "any" | "restaurant" | "stay-end", number> = {
-        "stay-start": -1,
-        morning: 0,
-        afternoon: 1,
-        evening: 2,
-        any: 3,
-        restaurant: 3,
-        "stay-end": 4,
-      };
-      return locations
-        .filter((loc) => loc.mode === "grouped" && loc.day === day)
-        .sort((a, b) => {
-          const aScore = score[(a.slot as keyof typeof score) || "any"] ?? 3;
-          const bScore = score[(b.slot as keyof typeof score) || "any"] ?? 3;
-          if (aScore !== bScore) return aScore - bScore;
-          return a.actIndex - b.actIndex;
-        });
-    },
-    [locations]
-  );
-
   const dayRouteLegs = useMemo(() => {
     if (!isGroupedMode) return [];
     const legs: Array<{
@@ -646,23 +722,36 @@ function GoogleMapContent({
       destination: Coordinates;
     }> = [];
 
-    const days = Array.from(new Set(locations.filter((loc) => loc.mode === "grouped").map((loc) => loc.day)));
-    days.forEach((day) => {
-      const ordered = sortLocationsForDay(day).filter((loc) => Number.isFinite(loc.lat) && Number.isFinite(loc.lng));
-      ordered.forEach((current, idx) => {
+    // Bucket grouped locations by day in one pass instead of re-filtering the full list per day.
+    // Grouped locations only get pushed after hasValidCoordinates/resolveMarkerCoordinates, so
+    // their lat/lng are already finite and don't need re-checking here.
+    const locationsByDay = new Map<number, Location[]>();
+    for (const loc of locations) {
+      if (loc.mode !== "grouped") continue;
+      const dayLocations = locationsByDay.get(loc.day);
+      if (dayLocations) {
+        dayLocations.push(loc);
+      } else {
+        locationsByDay.set(loc.day, [loc]);
+      }
+    }
+
+    locationsByDay.forEach((dayLocations, day) => {
+      const ordered = dayLocations.sort(compareDayRouteLocations);
+      for (let idx = 0; idx < ordered.length - 1; idx += 1) {
+        const current = ordered[idx];
         const next = ordered[idx + 1];
-        if (!next) return;
         legs.push({
           id: `day-${day}-${current.activityId || current.name}-${next.activityId || next.name}`,
           day,
           origin: { lat: current.lat, lng: current.lng },
           destination: { lat: next.lat, lng: next.lng },
         });
-      });
+      }
     });
 
     return legs;
-  }, [isGroupedMode, locations, sortLocationsForDay]);
+  }, [isGroupedMode, locations]);
 
   const dayRouteLegsToFetch = useMemo(
     () => dayRouteLegs.filter((leg) => !dayRouteOverlays[leg.id]),
@@ -770,6 +859,35 @@ function GoogleMapContent({
     return decoded;
   }, [isLoaded, dayRouteOverlays]);
 
+  // Bounding boxes for decoded route polylines, used to skip drawing routes that are fully off-screen.
+  const routePathBounds = useMemo(() => {
+    const boundsById: Record<string, google.maps.LatLngBoundsLiteral> = {};
+    [decodedRoutePaths, decodedDayRoutePaths].forEach((paths) => {
+      Object.entries(paths).forEach(([id, path]) => {
+        const pathBounds = getPathBounds(path);
+        if (pathBounds) boundsById[id] = pathBounds;
+      });
+    });
+    return boundsById;
+  }, [decodedRoutePaths, decodedDayRoutePaths]);
+
+  // Only grouped mode draws route polylines, so only track the viewport there; elsewhere an idle
+  // handler would re-render every marker on each pan/zoom for nothing.
+  const shouldCullRoutes = isGroupedMode && Object.keys(routePathBounds).length > 0;
+
+  const isRouteInViewport = (id: string) => {
+    const pathBounds = routePathBounds[id];
+    return !shouldCullRoutes || !viewportBounds || !pathBounds || viewportBounds.intersects(pathBounds);
+  };
+
+  const onIdle = useCallback(() => {
+    if (!map) return;
+    const nextBounds = map.getBounds() ?? null;
+    setViewportBounds((previous) =>
+      previous && nextBounds && previous.equals(nextBounds) ? previous : nextBounds
+    );
+  }, [map]);
+
   // Geocode destination if no locations available
   useEffect(() => {
     if (isLoaded && locations.length === 0 && destination && window.google) {
@@ -783,24 +901,10 @@ function GoogleMapContent({
     }
   }, [isLoaded, locations.length, destination]);
 
-  // Fit bounds when map loads
-  const onLoad = useCallback(
-    (mapInstance: google.maps.Map) => {
-      setMap(mapInstance);
-      if (locations.length > 0 || routeSegments.length > 0) {
-        const bounds = new window.google.maps.LatLngBounds();
-        locations.forEach((loc) => bounds.extend({ lat: loc.lat, lng: loc.lng }));
-        routeSegments.forEach((path) => {
-          path.points.forEach((point) => bounds.extend(point));
-        });
-        mapInstance.fitBounds(
-          bounds,
-          isTimelineMode ? { top: 56, right: 28, bottom: 92, left: 28 } : { top: 50, right: 50, bottom: 50, left: 50 }
-        );
-      }
-    },
-    [isTimelineMode, locations, routeSegments]
-  );
+  // Bounds are fitted by the effect below once the map instance is available, so onLoad only stores it.
+  const onLoad = useCallback((mapInstance: google.maps.Map) => {
+    setMap(mapInstance);
+  }, []);
 
   // Reset bounds tracking when locations count changes (new data loaded)
   useEffect(() => {
@@ -818,29 +922,11 @@ function GoogleMapContent({
       routeSegments.forEach((path) => {
         path.points.forEach((point) => bounds.extend(point));
       });
-      map.fitBounds(bounds, isTimelineMode ? { top: 56, right: 28, bottom: 92, left: 28 } : { top: 50, right: 50, bottom: 50, left: 50 });
+      map.fitBounds(bounds, isTimelineMode ? TIMELINE_FIT_BOUNDS_PADDING : DEFAULT_FIT_BOUNDS_PADDING);
       boundsSetRef.current = true;
     }
   }, [isTimelineMode, map, locations, routeSegments]);
 
-  const stayIconUrl = useMemo(() => {
-    const svg = `
-      <svg xmlns="http://www.w3.org/2000/svg" width="48" height="48" viewBox="0 0 48 48">
-        <g fill="none" stroke="#111827" stroke-width="2.4" stroke-linejoin="round" stroke-linecap="round">
-          <path d="M6 22L24 8l18 14" fill="none"/>
-          <polygon points="24,8 42,22 42,36 6,36 6,22" fill="#F3F4F6"/>
-          <polygon points="24,8 42,22 38,22 24,12 10,22 6,22" fill="#EF4444"/>
-          <rect x="21" y="24" width="6" height="12" rx="1.2" fill="#EF4444"/>
-          <rect x="11" y="24" width="7" height="7" rx="1" fill="#38BDF8"/>
-          <rect x="30" y="24" width="7" height="7" rx="1" fill="#38BDF8"/>
-          <rect x="36" y="14" width="4" height="8" rx="1" fill="#EF4444"/>
-          <path d="M30 36c2.5-4 7-4 9 0" fill="#22C55E" stroke="#16A34A"/>
-        </g>
-      </svg>
-    `;
-    return `data:image/svg+xml;utf8,${encodeURIComponent(svg.trim())}`;
-  }, []);
-
   // Get marker icon based on day or selection state
   const getMarkerIcon = (loc: Location): google.maps.Symbol | google.maps.Icon => {
     const isHovered =
@@ -851,7 +937,7 @@ function GoogleMapContent({
 
     if (isStayMarker) {
       return {
-        url: stayIconUrl,
+        url: STAY_ICON_URL,
         scaledSize: new window.google.maps.Size(isHovered ? 40 : 36, isHovered ? 40 : 36),
         anchor: new window.google.maps.Point(isHovered ? 20 : 18, isHovered ? 40 : 36),
         labelOrigin: new window.google.maps.Point(isHovered ? 20 : 18, 12),
@@ -860,14 +946,13 @@ function GoogleMapContent({
 
     if (isRestaurantMarker) {
       return {
-        path: "M12 0C7.58 0 4 3.58 4 8c0 5.25 8 13 8 13s8-7.75 8-13c0-4.42-3.58-8-8-8z",
+        path: MARKER_PIN_PATH,
         fillColor: "#F59E0B",
         fillOpacity: isHovered ? 1 : 0.9,
         strokeColor: isHovered ? "#1F2937" : "#ffffff",
         strokeWeight: isHovered ? 2 : 1,
         scale: isHovered ? 1.95 : 1.5,
-        anchor: new window.google.maps.Point(12, 21),
-        labelOrigin: new window.google.maps.Point(12, 8),
+        ...getPinIconPoints(),
       };
     }
 
@@ -894,42 +979,39 @@ function GoogleMapContent({
     if (isResearchSelectionMode) {
       const fillColor = loc.isSelected ? "#3B82F6" : "#9CA3AF";
       return {
-        path: "M12 0C7.58 0 4 3.58 4 8c0 5.25 8 13 8 13s8-7.75 8-13c0-4.42-3.58-8-8-8z",
+        path: MARKER_PIN_PATH,
         fillColor,
         fillOpacity: loc.isSelected || isHovered ? 1 : 0.6,
         strokeColor: isHovered ? "#1F2937" : "#ffffff",
         strokeWeight: isHovered ? 2 : 1,
         scale: isHovered ? 2.1 : (loc.isSelected ? 1.75 : 1.3),
-        anchor: new window.google.maps.Point(12, 21),
-        labelOrigin: new window.google.maps.Point(12, 8),
+        ...getPinIconPoints(),
       };
     }
 
     // In suggested-activity selection mode, use selected/unselected colors
     if (isActivitySelectionMode) {
       return {
-        path: "M12 0C7.58 0 4 3.58 4 8c0 5.25 8 13 8 13s8-7.75 8-13c0-4.42-3.58-8-8-8z",
+        path: MARKER_PIN_PATH,
         fillColor: loc.isSelected ? SELECTED_COLOR : UNSELECTED_COLOR,
         fillOpacity: loc.isSelected || isHovered ? 1 : 0.6,
         strokeColor: isHovered ? "#3B82F6" : "#ffffff",
         strokeWeight: isHovered ? 2 : 1,
         scale: isHovered ? 2.1 : (loc.isSelected ? 1.7 : 1.35),
-        anchor: new window.google.maps.Point(12, 21),
-        labelOrigin: new window.google.maps.Point(12, 8),
+        ...getPinIconPoints(),
       };
     }
 
     // Otherwise use day-based pins (not just circles anymore, for consistency with numbers)
     const isHighlighted = loc.day === highlightedDay;
     return {
-      path: "M12 0C7.58 0 4 3.58 4 8c0 5.25 8 13 8 13s8-7.75 8-13c0-4.42-3.58-8-8-8z",
+      path: MARKER_PIN_PATH,
       fillColor: getDayColor(loc.day),
       fillOpacity: isHighlighted || highlightedDay == null ? 1 : 0.4,
       strokeColor: isHovered ? "#3B82F6" : (isHighlighted ? "#000000" : "#ffffff"),
       strokeWeight: isHovered || isHighlighted ? 2 : 1,
       scale: isHovered ? 2.0 : (isHighlighted ? 1.85 : 1.45),
-      anchor: new window.google.maps.Point(12, 21),
-      labelOrigin: new window.google.maps.Point(12, 8),
+      ...getPinIconPoints(),
     };
   };
 
@@ -965,6 +1047,56 @@ function GoogleMapContent({
     };
   };
 
+  // Build marker event handlers once per location set rather than fresh closures on every hover re-render.
+  const markerHandlers = useMemo(
+    () =>
+      locations.map((loc) => ({
+        onClick: () => {
+          if (isActivitySelectionMode && onActivityClick && loc.activityId) {
+            onActivityClick(loc.activityId);
+          } else {
+            setSelectedMarker(loc);
+          }
+        },
+        onMouseOver: () => setHoveredMarker(loc),
+      })),
+    [locations, isActivitySelectionMode, onActivityClick]
+  );
+  const clearHoveredMarker = useCallback(() => setHoveredMarker(null), []);
+
+  const renderLocationMarker = (loc: Location, idx: number, clusterer?: MarkerProps["clusterer"]) => {
+    const isStayMarker = loc.slot === "stay-start" || loc.slot === "stay-end";
+    const isRestaurantMarker = loc.slot === "restaurant";
+    return (
+      <Marker
+        key={idx}
+        clusterer={clusterer}
+        position={{ lat: loc.lat, lng: loc.lng }}
+        icon={getMarkerIcon(loc)}
+        label={
+          isStayMarker || isRestaurantMarker || loc.mode === "timeline"
+            ? undefined
+            : {
+              text: (loc.actIndex + 1).toString(),
+              color: loc.mode === "research" || loc.mode === "suggested" ? (loc.isSelected ? "white" : "#6B7280") : "white",
+              fontWeight: "700",
+              fontSize: (loc.activityId === hoveredActivityId || isGroupedMode) ? "11px" : "10px",
+            }
+        }
+        onClick={markerHandlers[idx].onClick}
+        onMouseOver={markerHandlers[idx].onMouseOver}
+        onMouseOut={clearHoveredMarker}
+        zIndex={
+          loc.mode === "timeline"
+            ? (loc.timelineKind === "country" ? 2200 : loc.timelineKind === "trip" ? 2100 : loc.timelineKind === "city" ? 2000 : 1900)
+            : isResearchSelectionMode ? (loc.isSelected ? 2000 : 1000) : 1500
+        }
+      />
+    );
+  };
+
+  const shouldClusterMarkers = isTimelineMode && locations.length >= TIMELINE_CLUSTER_MIN_LOCATIONS;
+
   const mapCenterLat = locations.length > 0 ? locations[0].lat : undefined;
   const mapCenterLng = locations.length > 0 ? locations[0].lng : undefined;
 
@@ -1006,6 +1138,7 @@ function GoogleMapContent({
       center={mapCenter}
       zoom={locations.length > 0 ? (isTimelineMode ? 4 : 12) : 11}
       onLoad={onLoad}
+      onIdle={shouldCullRoutes ? onIdle : undefined}
       options={{
         streetViewControl: false,
         mapTypeControl: false,
@@ -1017,7 +1150,7 @@ function GoogleMapContent({
       {isGroupedMode
         ? dayRouteLegs.map((leg) => {
           const path = decodedDayRoutePaths[leg.id];
-          if (!path || path.length < 2) return null;
+          if (!path || path.length < 2 || !isRouteInViewport(leg.id)) return null;
           return (
             <Polyline
               key={`day-route-${leg.id}`}
@@ -1035,7 +1168,7 @@ function GoogleMapContent({
       {isGroupedMode
         ? routeSegments.map((segment) => {
           const decodedPath = decodedRoutePaths[segment.id];
-          if (!decodedPath || decodedPath.length < 2) return null;
+          if (!decodedPath || decodedPath.length < 2 || !isRouteInViewport(segment.id)) return null;
           const strokeColor = segment.day ? getDayColor(segment.day) : "#2563EB";
           return (
             <Polyline
@@ -1061,14 +1194,13 @@ function GoogleMapContent({
               key={`${path.id}-${index}`}
               position={waypoint.coordinates}
               icon={{
-                path: "M12 0C7.58 0 4 3.58 4 8c0 5.25 8 13 8 13s8-7.75 8-13c0-4.42-3.58-8-8-8z",
+                path: MARKER_PIN_PATH,
                 fillColor: style.fillColor,
                 fillOpacity: style.fillOpacity,
                 strokeColor: style.strokeColor,
                 strokeWeight: 1,
                 scale,
-                anchor: new window.google.maps.Point(12, 21),
-                labelOrigin: new window.google.maps.Point(12, 8),
+                ...getPinIconPoints(),
               }}
               label={{
                 text: `${path.baseLabel}.${index + 1}`,
@@ -1084,41 +1216,13 @@ function GoogleMapContent({
       )}
 
       {/* Draw markers for each location */}
-      {locations.map((loc, idx) => {
-        const isStayMarker = loc.slot === "stay-start" || loc.slot === "stay-end";
-        const isRestaurantMarker = loc.slot === "restaurant";
-        return (
-          <Marker
-            key={idx}
-            position={{ lat: loc.lat, lng: loc.lng }}
-            icon={getMarkerIcon(loc)}
-            label={
-              isStayMarker || isRestaurantMarker || loc.mode === "timeline"
-                ? undefined
-                : {
-                  text: (loc.actIndex + 1).toString(),
-                  color: loc.mode === "research" || loc.mode === "suggested" ? (loc.isSelected ? "white" : "#6B7280") : "white",
-                  fontWeight: "700",
-                  fontSize: (loc.activityId === hoveredActivityId || isGroupedMode) ? "11px" : "10px",
-                }
-            }
-            onClick={() => {
-              if (isActivitySelectionMode && onActivityClick && loc.activityId) {
-                onActivityClick(loc.activityId);
-              } else {
-                setSelectedMarker(loc);
-              }
-            }}
-            onMouseOver={() => setHoveredMarker(loc)}
-            onMouseOut={() => setHoveredMarker(null)}
-            zIndex={
-              loc.mode === "timeline"
-                ? (loc.timelineKind === "country" ? 2200 : loc.timelineKind === "trip" ? 2100 : loc.timelineKind === "city" ? 2000 : 1900)
-                : isResearchSelectionMode ? (loc.isSelected ? 2000 : 1000) : 1500
-            }
-          />
-        );
-      })}
+      {shouldClusterMarkers ? (
+        <MarkerClusterer options={{ averageCenter: true, minimumClusterSize: 3 }}>
+          {(clusterer) => <>{locations.map((loc, idx) => renderLocationMarker(loc, idx, clusterer))}</>}
+        </MarkerClusterer>
+      ) : (
+        locations.map((loc, idx) => renderLocationMarker(loc, idx))
+      )}
 
       {/* Hover tooltip */}
       {hoveredMarker && <HoverTooltip location={hoveredMarker} />}
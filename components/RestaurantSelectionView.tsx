@@ -7,6 +7,21 @@ import { Button } from "@/components/ui/button";
 import { Check, Star, MapPin, Clock, ExternalLink, Globe, X } from "lucide-react";
 import type { RestaurantSuggestion } from "@/lib/api-client";
 
+const CUISINE_COLORS: Record<string, string> = {
+  italian: "bg-green-100 text-green-800",
+  chinese: "bg-red-100 text-red-800",
+  japanese: "bg-pink-100 text-pink-800",
+  mexican: "bg-orange-100 text-orange-800",
+  indian: "bg-amber-100 text-amber-800",
+  thai: "bg-purple-100 text-purple-800",
+  french: "bg-blue-100 text-blue-800",
+  american: "bg-indigo-100 text-indigo-800",
+  mediterranean: "bg-cyan-100 text-cyan-800",
+  vietnamese: "bg-teal-100 text-teal-800",
+  korean: "bg-rose-100 text-rose-800",
+  greek: "bg-sky-100 text-sky-800",
+};
+
 interface RestaurantSelectionViewProps {
   restaurants: RestaurantSuggestion[];
   selectedIds: string[];
@@ -55,21 +70,7 @@ export function RestaurantSelectionView({
 
   const getCuisineColor = (cuisine: string | null): string => {
     if (!cuisine) return "bg-gray-100 text-gray-800";
-    const colors: Record<string, string> = {
-      italian: "bg-green-100 text-green-800",
-      chinese: "bg-red-100 text-red-800",
-      japanese: "bg-pink-100 text-pink-800",
-      mexican: "bg-orange-100 text-orange-800",
-      indian: "bg-amber-100 text-amber-800",
-      thai: "bg-purple-100 text-purple-800",
-      french: "bg-blue-100 text-blue-800",
-      american: "bg-indigo-100 text-indigo-800",
-      mediterranean: "bg-cyan-100 text-cyan-800",
-      vietnamese: "bg-teal-100 text-teal-800",
-      korean: "bg-rose-100 text-rose-800",
-      greek: "bg-sky-100 text-sky-800",
-    };
-    return colors[cuisine.toLowerCase()] || "bg-gray-100 text-gray-800";
+    return CUISINE_COLORS[cuisine.toLowerCase()] || "bg-gray-100 text-gray-800";
   };
 
   const openInMaps = (restaurant: RestaurantSuggestion) => {
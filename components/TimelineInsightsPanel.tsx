@@ -29,8 +29,9 @@ const VIEW_LABELS: Record<TimelineMapView, string> = {
 function formatDuration(totalMinutes: number): string {
   if (totalMinutes < 60) return `${Math.max(1, Math.round(totalMinutes))} min`;
 
-  const hours = Math.floor(totalMinutes / 60);
-  const minutes = Math.round(totalMinutes % 60);
+  const roundedMinutes = Math.round(totalMinutes);
+  const hours = Math.floor(roundedMinutes / 60);
+  const minutes = roundedMinutes % 60;
   if (hours < 24) {
     return minutes > 0 ? `${hours}h ${minutes}m` : `${hours}h`;
   }
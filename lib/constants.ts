@@ -26,23 +26,24 @@ export function getDayColor(dayNumber: number): string {
     return DAY_COLORS[(num - 1) % DAY_COLORS.length];
 }
 
+// Tailwind badge classes keyed by day number (1-10)
+const DAY_BADGE_COLORS: Record<number, string> = {
+    1: "bg-red-200 text-red-900",
+    2: "bg-blue-200 text-blue-900",
+    3: "bg-green-200 text-green-900",
+    4: "bg-orange-200 text-orange-900",
+    5: "bg-purple-200 text-purple-900",
+    6: "bg-cyan-200 text-cyan-900",
+    7: "bg-amber-200 text-amber-900",
+    8: "bg-violet-200 text-violet-900",
+    9: "bg-pink-200 text-pink-900",
+    10: "bg-teal-200 text-teal-900",
+};
+
 /**
  * Get Tailwind background and text color classes for a day badge
  */
 export function getDayBadgeColors(dayNumber: number): string {
-    const colorMap: Record<number, string> = {
-        1: "bg-red-200 text-red-900",
-        2: "bg-blue-200 text-blue-900",
-        3: "bg-green-200 text-green-900",
-        4: "bg-orange-200 text-orange-900",
-        5: "bg-purple-200 text-purple-900",
-        6: "bg-cyan-200 text-cyan-900",
-        7: "bg-amber-200 text-amber-900",
-        8: "bg-violet-200 text-violet-900",
-        9: "bg-pink-200 text-pink-900",
-        10: "bg-teal-200 text-teal-900",
-    };
-
     const num = ((dayNumber - 1) % 10) + 1;
-    return colorMap[num] || "bg-gray-200 text-gray-900";
+    return DAY_BADGE_COLORS[num] || "bg-gray-200 text-gray-900";
 }
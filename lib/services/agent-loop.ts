@@ -32,15 +32,16 @@ import { groupActivitiesByDayWithStrategy } from "@/lib/services/day-grouping-se
 import type { ActivityGroupingStrategy } from "@/lib/services/day-grouping/types";
 import { assignNightStays } from "@/lib/services/night-stays";
 import { getPlacesClient } from "@/lib/services/places-client";
-import type { PlaceResult } from "@/lib/services/places-client";
 import { getPriceRangeSymbol } from "@/lib/utils/currency";
 import { chooseAuthoritativeScheduleBase } from "@/lib/utils/schedule-source";
+import { takeRecentConversation } from "@/lib/utils/conversation-window";
 import { getLLMClient, PLANNING_AND_REVIEW_TOOLS } from "@/lib/services/llm-client";
 import { mergeResearchBriefAndSelections } from "@/lib/services/card-merging";
 import { runAccommodationSearch, runFlightSearch } from "@/lib/services/sub-agent-search";
 import {
   buildRestaurantQueries,
 } from "@/lib/services/restaurant-dietary";
+import { getCentroid, searchRestaurantsWithFallbacks, takeUniquePlaces } from "@/lib/services/restaurant-search";
 
 const DEFAULT_CONFIDENCE_THRESHOLD = 0.55;
 
@@ -238,7 +239,7 @@ function buildLoopContext(session: Session): LoopContext {
     selectedFlightOptionId: session.selectedFlightOptionId,
     wantsAccommodation: session.wantsAccommodation,
     wantsFlight: session.wantsFlight,
-    conversationTail: (session.conversationHistory || []).slice(-10),
+    conversationTail: takeRecentConversation(session.conversationHistory, 10),
   };
 }
 
@@ -290,58 +291,6 @@ function getCurrencyFromSession(session: Session): string {
   return "USD";
 }
 
-function getCentroid(coordinates: Array<{ lat: number; lng: number }>) {
-  if (coordinates.length === 0) return { lat: 0, lng: 0 };
-  const sum = coordinates.reduce(
-    (acc, coord) => ({
-      lat: acc.lat + (typeof coord.lat === "string" ? parseFloat(coord.lat) : coord.lat),
-      lng: acc.lng + (typeof coord.lng === "string" ? parseFloat(coord.lng) : coord.lng)
-    }),
-    { lat: 0, lng: 0 },
-  );
-  return {
-    lat: sum.lat / coordinates.length,
-    lng: sum.lng / coordinates.length,
-  };
-}
-
-function dedupePlacesById<T extends { place_id: string }>(places: T[]): T[] {
-  const byId = new Map<string, T>();
-  for (const place of places) {
-    if (!byId.has(place.place_id)) {
-      byId.set(place.place_id, place);
-    }
-  }
-  return Array.from(byId.values());
-}
-
-async function searchRestaurantsWithFallbacks(
-  query: string,
-  allCoordinates: Array<{ lat: number; lng: number }>,
-  centroid: { lat: number; lng: number },
-  destination: string | null,
-  placesClient: ReturnType<typeof getPlacesClient>,
-): Promise<PlaceResult[]> {
-  let places = await placesClient.searchPlaces(query, centroid, 3000, "restaurant");
-
-  if (places.length === 0) {
-    places = await placesClient.searchPlaces(query, centroid, 12000, "restaurant");
-  }
-
-  if (places.length === 0) {
-    const perActivityResults = await Promise.all(
-      allCoordinates.slice(0, 8).map((coord) => placesClient.searchPlaces(query, coord, 6000, "restaurant")),
-    );
-    places = dedupePlacesById(perActivityResults.flat());
-  }
-
-  if (places.length === 0 && destination) {
-    places = await placesClient.searchPlaces(`${query} in ${destination}`, null, 5000, "restaurant");
-  }
-
-  return places;
-}
-
 function distributeRestaurantsAcrossDays(
   groupedDays: GroupedDay[],
   selectedRestaurants: RestaurantSuggestion[],
@@ -707,10 +656,10 @@ async function executeAction({
         searchRestaurantsWithFallbacks(query, allCoordinates, centroid, session.tripInfo.destination, placesClient),
       ),
     );
-    const places = dedupePlacesById(placeGroups.flat());
+    const places = takeUniquePlaces(placeGroups, 10);
 
     const restaurants: RestaurantSuggestion[] = await Promise.all(
-      places.slice(0, 10).map(async (place, index) => {
+      places.map(async (place, index) => {
         try {
           const details = place.place_id ? await placesClient.getPlaceDetails(place.place_id) : null;
           const photoUrls =
@@ -881,7 +830,10 @@ async function executeAction({
       ...session,
       selectedActivityIds: working.selectedActivityIds,
     };
-    const result = await runAccommodationSearch({ session: simulatedSession });
+    const result = await runAccommodationSearch({
+      session: simulatedSession,
+      forceRefresh: action.tool === "refresh_accommodation_search",
+    });
     working.accommodationStatus = result.success ? "complete" : "error";
     working.accommodationError = result.success ? null : result.message;
     working.accommodationOptions = result.options;
@@ -902,7 +854,10 @@ async function executeAction({
       ...session,
       selectedActivityIds: working.selectedActivityIds,
     };
-    const result = await runFlightSearch({ session: simulatedSession });
+    const result = await runFlightSearch({
+      session: simulatedSession,
+      forceRefresh: action.tool === "refresh_flight_search",
+    });
     working.flightStatus = result.success ? "complete" : "error";
     working.flightError = result.success ? null : result.message;
     working.flightOptions = result.options;
@@ -1213,7 +1168,7 @@ async function runInfoGatheringTurn({
   const result = await llmClient.gatherInfo({
     tripInfo: session.tripInfo,
     userMessage: request.message,
-    conversationHistory: (session.conversationHistory || []).slice(-10),
+    conversationHistory: takeRecentConversation(session.conversationHistory, 10),
   });
   const explicitVisitedDestinations = extractVisitedDestinationsFromUserMessage(request.message);
   if (explicitVisitedDestinations.length > 0 && result.tripInfo) {
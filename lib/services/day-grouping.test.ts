@@ -11,6 +11,10 @@ import {
     getLoadDurationHours,
     buildPreparedActivityMap,
     buildScoredSchedule,
+    parseRouteMatrixEntries,
+    parseDate,
+    countTripDays,
+    buildTripDates,
 } from './day-grouping'
 import type { SuggestedActivity } from '@/lib/models/travel-plan'
 import type { PreparedActivity } from './day-grouping'
@@ -57,6 +61,53 @@ describe('day-grouping duration parsing', () => {
     });
 });
 
+describe('day-grouping route matrix parsing', () => {
+    it('should parse a JSON array body', () => {
+        const raw = '[{"originIndex":0,"destinationIndex":1,"duration":"60s"},null]';
+        expect(parseRouteMatrixEntries(raw)).toEqual([
+            { originIndex: 0, destinationIndex: 1, duration: '60s' },
+        ]);
+    });
+
+    it('should parse an NDJSON body line by line', () => {
+        const raw = '{"originIndex":0,"destinationIndex":1}\n\n{"originIndex":1,"destinationIndex":0}\nnot-json';
+        expect(parseRouteMatrixEntries(raw)).toEqual([
+            { originIndex: 0, destinationIndex: 1 },
+            { originIndex: 1, destinationIndex: 0 },
+        ]);
+    });
+
+    it('should strip the XSSI prefix', () => {
+        expect(parseRouteMatrixEntries(")]}'\n[{\"originIndex\":2}]")).toEqual([{ originIndex: 2 }]);
+    });
+});
+
+describe('day-grouping trip dates', () => {
+    it('should parse ISO dates as UTC midnight', () => {
+        expect(parseDate('2025-03-08')?.toISOString()).toBe('2025-03-08T00:00:00.000Z');
+    });
+
+    it('should reject out-of-range ISO dates', () => {
+        expect(parseDate('2025-02-30')).toBeNull();
+        expect(parseDate('2025-13-01')).toBeNull();
+    });
+
+    it('should count trip days inclusively', () => {
+        expect(countTripDays('2025-03-08', '2025-03-12')).toBe(5);
+        expect(countTripDays('2025-03-12', '2025-03-08')).toBeNull();
+        expect(countTripDays(null, '2025-03-08')).toBeNull();
+    });
+
+    it('should build consecutive dates across month and DST boundaries', () => {
+        expect(buildTripDates({ startDate: '2025-10-31' } as any, 4)).toEqual([
+            '2025-10-31',
+            '2025-11-01',
+            '2025-11-02',
+            '2025-11-03',
+        ]);
+    });
+});
+
 describe('day-grouping structural stats', () => {
     it('should calculate stats for an empty day', () => {
         const stats = getDayStructuralStats([], new Map(), new Map(), {
@@ -13,6 +13,8 @@ import {
 
 const ROUTE_MATRIX_API_URL = "https://routes.googleapis.com/distanceMatrix/v2:computeRouteMatrix";
 const ROUTE_MATRIX_MAX_LOCATIONS = 25;
+const ROUTE_MATRIX_CONCURRENCY = 4;
+const ROUTE_DURATION_PATTERN = /^\s*([\d.]+)s\s*$/;
 
 export function haversineDistanceKm(
     a: { lat: number; lng: number } | null | undefined,
@@ -30,17 +32,47 @@ export function haversineDistanceKm(
     const h =
         Math.sin(dLat / 2) * Math.sin(dLat / 2) +
         Math.sin(dLng / 2) * Math.sin(dLng / 2) * Math.cos(lat1) * Math.cos(lat2);
-    const c = 2 * Math.atan2(Math.sqrt(h), Math.sqrt(1 - h));
+    const c = 2 * Math.asin(Math.min(1, Math.sqrt(h)));
     return r * c;
 }
 
+/**
+ * Minimum great-circle distance between any point of `pointsA` and any point of `pointsB`.
+ * Latitude cosines are computed once per point rather than once per pair, and the
+ * arcsine is only evaluated for the closest pair since it is monotonic in `h`.
+ */
+function minHaversineDistanceKm(
+    pointsA: Array<{ lat: number; lng: number }>,
+    pointsB: Array<{ lat: number; lng: number }>
+): number {
+    if (pointsA.length === 0 || pointsB.length === 0) return Number.POSITIVE_INFINITY;
+
+    const degToRad = Math.PI / 180;
+    const latsB = pointsB.map((point) => point.lat * degToRad);
+    const cosLatsB = latsB.map((lat) => Math.cos(lat));
+
+    let minH = Number.POSITIVE_INFINITY;
+    for (const pointA of pointsA) {
+        const latA = pointA.lat * degToRad;
+        const cosLatA = Math.cos(latA);
+        for (let j = 0; j < pointsB.length; j += 1) {
+            const sinHalfDLat = Math.sin((latsB[j] - latA) / 2);
+            const sinHalfDLng = Math.sin(((pointsB[j].lng - pointA.lng) * degToRad) / 2);
+            const h = sinHalfDLat * sinHalfDLat + sinHalfDLng * sinHalfDLng * cosLatA * cosLatsB[j];
+            if (h < minH) minH = h;
+        }
+    }
+
+    return 6371 * 2 * Math.asin(Math.min(1, Math.sqrt(minH)));
+}
+
 export function getRoutesApiKey(): string | null {
     return process.env.GOOGLE_MAPS_API_KEY || process.env.GOOGLE_PLACES_API_KEY || null;
 }
 
 export function parseRouteDurationSeconds(duration?: string): number | null {
     if (!duration) return null;
-    const match = duration.match(/^\s*([\d.]+)s\s*$/);
+    const match = ROUTE_DURATION_PATTERN.exec(duration);
     if (!match) return null;
     const seconds = Number.parseFloat(match[1]);
     return Number.isFinite(seconds) ? Math.round(seconds) : null;
@@ -166,13 +198,17 @@ export function parseRouteMatrixEntries(rawText: string): Array<Record<string, u
     if (!trimmed) return [];
 
     const normalized = trimmed.startsWith(")]}'") ? trimmed.slice(4).trim() : trimmed;
-    try {
-        const parsed = JSON.parse(normalized);
-        if (Array.isArray(parsed)) {
-            return parsed.filter((item): item is Record<string, unknown> => item !== null && typeof item === "object");
+    // The Route Matrix REST response is often NDJSON; only attempt a whole-body parse
+    // when it is a JSON array so NDJSON bodies are not parsed (and thrown on) twice.
+    if (normalized.startsWith("[")) {
+        try {
+            const parsed = JSON.parse(normalized);
+            if (Array.isArray(parsed)) {
+                return parsed.filter((item): item is Record<string, unknown> => item !== null && typeof item === "object");
+            }
+        } catch {
+            // Fall through to line-by-line parsing.
         }
-    } catch {
-        // The Route Matrix REST response is often NDJSON.
     }
 
     return normalized
@@ -224,75 +260,94 @@ export async function computeActivityCommuteMatrix(activities: SuggestedActivity
 
     const apiKey = getRoutesApiKey();
     if (apiKey && valid.length > 1) {
-        try {
-            for (let originStart = 0; originStart < valid.length; originStart += ROUTE_MATRIX_MAX_LOCATIONS) {
-                const originChunk = valid.slice(originStart, originStart + ROUTE_MATRIX_MAX_LOCATIONS);
-                for (let destinationStart = 0; destinationStart < valid.length; destinationStart += ROUTE_MATRIX_MAX_LOCATIONS) {
-                    const destinationChunk = valid.slice(destinationStart, destinationStart + ROUTE_MATRIX_MAX_LOCATIONS);
-                    const body = {
-                        origins: originChunk.map((origin) => ({
-                            waypoint: {
-                                location: {
-                                    latLng: {
-                                        latitude: origin.point.lat,
-                                        longitude: origin.point.lng,
-                                    },
+        const chunkPairs: Array<{ originChunk: typeof valid; destinationChunk: typeof valid }> = [];
+        for (let originStart = 0; originStart < valid.length; originStart += ROUTE_MATRIX_MAX_LOCATIONS) {
+            const originChunk = valid.slice(originStart, originStart + ROUTE_MATRIX_MAX_LOCATIONS);
+            for (let destinationStart = 0; destinationStart < valid.length; destinationStart += ROUTE_MATRIX_MAX_LOCATIONS) {
+                const destinationChunk = valid.slice(destinationStart, destinationStart + ROUTE_MATRIX_MAX_LOCATIONS);
+                chunkPairs.push({ originChunk, destinationChunk });
+            }
+        }
+
+        const fetchChunkPair = async ({ originChunk, destinationChunk }: (typeof chunkPairs)[number]) => {
+            try {
+                const body = {
+                    origins: originChunk.map((origin) => ({
+                        waypoint: {
+                            location: {
+                                latLng: {
+                                    latitude: origin.point.lat,
+                                    longitude: origin.point.lng,
                                 },
                             },
-                        })),
-                        destinations: destinationChunk.map((destination) => ({
-                            waypoint: {
-                                location: {
-                                    latLng: {
-                                        latitude: destination.point.lat,
-                                        longitude: destination.point.lng,
-                                    },
+                        },
+                    })),
+                    destinations: destinationChunk.map((destination) => ({
+                        waypoint: {
+                            location: {
+                                latLng: {
+                                    latitude: destination.point.lat,
+                                    longitude: destination.point.lng,
                                 },
                             },
-                        })),
-                        travelMode: "DRIVE",
-                        routingPreference: "TRAFFIC_UNAWARE",
-                        languageCode: "en-US",
-                    };
-
-                    const response = await fetch(ROUTE_MATRIX_API_URL, {
-                        method: "POST",
-                        headers: {
-                            "Content-Type": "application/json",
-                            "X-Goog-Api-Key": apiKey,
-                            "X-Goog-FieldMask": "originIndex,destinationIndex,duration,distanceMeters,status,condition",
                         },
-                        body: JSON.stringify(body),
-                    });
-
-                    if (!response.ok) {
-                        continue;
-                    }
+                    })),
+                    travelMode: "DRIVE",
+                    routingPreference: "TRAFFIC_UNAWARE",
+                    languageCode: "en-US",
+                };
+
+                const response = await fetch(ROUTE_MATRIX_API_URL, {
+                    method: "POST",
+                    headers: {
+                        "Content-Type": "application/json",
+                        "X-Goog-Api-Key": apiKey,
+                        "X-Goog-FieldMask": "originIndex,destinationIndex,duration,distanceMeters,status,condition",
+                    },
+                    body: JSON.stringify(body),
+                });
+
+                if (!response.ok) {
+                    return;
+                }
 
-                    const raw = await response.text();
-                    const entries = parseRouteMatrixEntries(raw);
-                    for (const entry of entries) {
-                        const originIndex = typeof entry.originIndex === "number" ? entry.originIndex : null;
-                        const destinationIndex = typeof entry.destinationIndex === "number" ? entry.destinationIndex : null;
-                        if (originIndex == null || destinationIndex == null) continue;
-                        const origin = originChunk[originIndex];
-                        const destination = destinationChunk[destinationIndex];
-                        if (!origin || !destination) continue;
-
-                        const durationSeconds = parseRouteDurationSeconds(
-                            typeof entry.duration === "string" ? entry.duration : undefined
-                        );
-                        if (durationSeconds == null) continue;
-                        routeMinutesByPointPair.set(
-                            activityPairKey(origin.id, destination.id),
-                            Math.max(5, Math.round(durationSeconds / 60))
-                        );
-                    }
+                const raw = await response.text();
+                const entries = parseRouteMatrixEntries(raw);
+                for (const entry of entries) {
+                    const originIndex = typeof entry.originIndex === "number" ? entry.originIndex : null;
+                    const destinationIndex = typeof entry.destinationIndex === "number" ? entry.destinationIndex : null;
+                    if (originIndex == null || destinationIndex == null) continue;
+                    const origin = originChunk[originIndex];
+                    const destination = destinationChunk[destinationIndex];
+                    if (!origin || !destination) continue;
+
+                    const durationSeconds = parseRouteDurationSeconds(
+                        typeof entry.duration === "string" ? entry.duration : undefined
+                    );
+                    if (durationSeconds == null) continue;
+                    routeMinutesByPointPair.set(
+                        activityPairKey(origin.id, destination.id),
+                        Math.max(5, Math.round(durationSeconds / 60))
+                    );
                 }
+            } catch {
+                // Ignore matrix errors and fall back to local estimates below.
             }
-        } catch {
-            // Ignore matrix errors and fall back to local estimates below.
-        }
+        };
+
+        // Matrix chunks are independent, but there are (n/25)^2 of them; keep a few in flight with a
+        // rolling pool so larger activity sets overlap round trips without tripping rate limits.
+        let nextChunkIndex = 0;
+        const worker = async () => {
+            while (nextChunkIndex < chunkPairs.length) {
+                const chunkPair = chunkPairs[nextChunkIndex];
+                nextChunkIndex += 1;
+                await fetchChunkPair(chunkPair);
+            }
+        };
+        await Promise.all(
+            Array.from({ length: Math.min(ROUTE_MATRIX_CONCURRENCY, chunkPairs.length) }, () => worker())
+        );
     }
 
     for (const from of activities) {
@@ -520,12 +575,7 @@ export function activityDistanceProxy(a: SuggestedActivity, b: SuggestedActivity
     let result: number | undefined;
 
     if (pointsA.length > 0 && pointsB.length > 0) {
-        let minDistance = Number.POSITIVE_INFINITY;
-        for (const pointA of pointsA) {
-            for (const pointB of pointsB) {
-                minDistance = Math.min(minDistance, haversineDistanceKm(pointA, pointB));
-            }
-        }
+        const minDistance = minHaversineDistanceKm(pointsA, pointsB);
         if (Number.isFinite(minDistance)) {
             result = minDistance;
         }
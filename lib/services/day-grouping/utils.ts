@@ -18,6 +18,8 @@ const ARRIVAL_RECOVERY_BUFFER_MINUTES = 120;
 const DEPARTURE_AIRPORT_LEAD_MINUTES = 120;
 const DEPARTURE_TRANSFER_MINUTES_ESTIMATE = 90;
 const DEPARTURE_COMMUTE_BUFFER_MINUTES = 20;
+const MS_PER_DAY = 1000 * 60 * 60 * 24;
+const ISO_DATE_PATTERN = /^(\d{4})-(\d{2})-(\d{2})$/;
 
 export function roundToQuarterMinutes(minutes: number): number {
     return Math.round(minutes / 15) * 15;
@@ -25,10 +27,31 @@ export function roundToQuarterMinutes(minutes: number): number {
 
 export function parseDate(value: string | null): Date | null {
     if (!value) return null;
+
+    // Trip dates are plain YYYY-MM-DD; build them directly as UTC midnight instead of
+    // going through the generic Date string parser.
+    const isoMatch = ISO_DATE_PATTERN.exec(value);
+    if (isoMatch) {
+        const year = Number(isoMatch[1]);
+        const monthIndex = Number(isoMatch[2]) - 1;
+        const day = Number(isoMatch[3]);
+        const date = new Date(Date.UTC(year, monthIndex, day));
+        return date.getUTCMonth() === monthIndex && date.getUTCDate() === day ? date : null;
+    }
+
     const date = new Date(value);
     return Number.isNaN(date.getTime()) ? null : date;
 }
 
+export function countTripDays(startDate: string | null, endDate: string | null): number | null {
+    const start = parseDate(startDate);
+    const end = parseDate(endDate);
+    if (!start || !end) return null;
+
+    const days = Math.floor((end.getTime() - start.getTime()) / MS_PER_DAY) + 1;
+    return days > 0 ? days : null;
+}
+
 export function toIsoDate(date: Date): string {
     return date.toISOString().slice(0, 10);
 }
@@ -39,13 +62,8 @@ export function computeDayCount(tripInfo: TripInfo, activityCount: number): numb
         return Math.max(1, Math.min(30, directDuration));
     }
 
-    const start = parseDate(tripInfo.startDate);
-    const end = parseDate(tripInfo.endDate);
-    if (start && end) {
-        const diffMs = end.getTime() - start.getTime();
-        const days = Math.floor(diffMs / (1000 * 60 * 60 * 24)) + 1;
-        if (days > 0) return Math.max(1, Math.min(30, days));
-    }
+    const days = countTripDays(tripInfo.startDate, tripInfo.endDate);
+    if (days) return Math.max(1, Math.min(30, days));
 
     if (activityCount <= 0) return 1;
     return Math.max(1, Math.min(7, activityCount));
@@ -57,7 +75,7 @@ export function buildTripDates(tripInfo: TripInfo, dayCount: number): string[] {
 
     for (let i = 0; i < dayCount; i += 1) {
         const next = new Date(start);
-        next.setDate(start.getDate() + i);
+        next.setUTCDate(start.getUTCDate() + i);
         dates.push(toIsoDate(next));
     }
 
@@ -217,6 +235,9 @@ export function normalizeType(type: string): string {
     return TYPE_THEME_MAP[normalized] ?? "Highlights";
 }
 
+const DURATION_NUMBER_PATTERN = /(\d+(?:\.\d+)?)/g;
+const DURATION_RANGE_PATTERN = /-|to/;
+
 export function parseDurationHours(estimatedDuration: string | null | undefined): number {
     if (!estimatedDuration) return 2;
     const text = estimatedDuration.toLowerCase();
@@ -224,12 +245,12 @@ export function parseDurationHours(estimatedDuration: string | null | undefined)
     if (text.includes("full day") || text.includes("all day")) return 8;
     if (text.includes("half day")) return 4;
 
-    const numbers = Array.from(text.matchAll(/(\d+(?:\.\d+)?)/g)).map((match) => Number(match[1]));
+    const numbers = Array.from(text.matchAll(DURATION_NUMBER_PATTERN)).map((match) => Number(match[1]));
     if (numbers.length === 0) return 2;
 
     const hasMinutes = text.includes("min");
     const hasHours = text.includes("hour") || text.includes("hr");
-    const isRange = /-|to/.test(text) && numbers.length >= 2;
+    const isRange = DURATION_RANGE_PATTERN.test(text) && numbers.length >= 2;
 
     if (isRange) {
         let value = (numbers[0] + numbers[1]) / 2;
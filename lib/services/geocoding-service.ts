@@ -1,5 +1,6 @@
-import { Client } from "@googlemaps/google-maps-services-js";
+import type { Client } from "@googlemaps/google-maps-services-js";
 import type { Coordinates } from "@/lib/models/travel-plan";
+import { getGoogleMapsClient } from "@/lib/services/google-maps-client";
 
 export interface GeocodeResult {
   location: Coordinates | null;
@@ -7,22 +8,50 @@ export interface GeocodeResult {
   countryCode?: string;
 }
 
+interface GeocodeCacheEntry<T> {
+  cachedAt: number;
+  result: T;
+}
+
 class GeocodingService {
   private client: Client;
   private apiKey: string;
+  private geocodeCache = new Map<string, GeocodeCacheEntry<GeocodeResult>>();
+  private reverseGeocodeCache = new Map<string, GeocodeCacheEntry<string>>();
+  private readonly cacheTtlMs = 1000 * 60 * 60 * 24 * 30;
+  private readonly cacheMaxEntries = 4096;
 
   constructor() {
-    const apiKey = process.env.GOOGLE_GEOCODING_API_KEY;
-    if (!apiKey) {
+    const rawApiKey = process.env.GOOGLE_GEOCODING_API_KEY;
+    if (!rawApiKey) {
       throw new Error("GOOGLE_GEOCODING_API_KEY not set.");
     }
 
-    if (!apiKey.trim()) {
+    const apiKey = rawApiKey.trim();
+    if (!apiKey) {
       throw new Error("GOOGLE_GEOCODING_API_KEY is empty.");
     }
 
-    this.client = new Client({});
-    this.apiKey = apiKey.trim();
+    this.client = getGoogleMapsClient();
+    this.apiKey = apiKey;
+  }
+
+  private getCached<T>(cache: Map<string, GeocodeCacheEntry<T>>, cacheKey: string): T | undefined {
+    const entry = cache.get(cacheKey);
+    if (!entry) return undefined;
+    if (Date.now() - entry.cachedAt > this.cacheTtlMs) {
+      cache.delete(cacheKey);
+      return undefined;
+    }
+    return entry.result;
+  }
+
+  private setCached<T>(cache: Map<string, GeocodeCacheEntry<T>>, cacheKey: string, result: T): void {
+    if (cache.size >= this.cacheMaxEntries) {
+      const oldestKey = cache.keys().next().value;
+      if (oldestKey !== undefined) cache.delete(oldestKey);
+    }
+    cache.set(cacheKey, { cachedAt: Date.now(), result });
   }
 
   async geocode(address: string): Promise<Coordinates | null> {
@@ -31,6 +60,12 @@ class GeocodingService {
   }
 
   async geocodeWithCountry(address: string): Promise<GeocodeResult> {
+    const cacheKey = address.trim().toLowerCase();
+    const cached = this.getCached(this.geocodeCache, cacheKey);
+    if (cached) {
+      return { ...cached, location: cached.location ? { ...cached.location } : null };
+    }
+
     try {
       const response = await this.client.geocode({
         params: {
@@ -45,11 +80,13 @@ class GeocodingService {
         const countryComponent = Array.isArray(primary.address_components)
           ? primary.address_components.find((component) => (component.types as string[])?.includes("country"))
           : undefined;
-        return {
+        const result: GeocodeResult = {
           location: { lat: location.lat, lng: location.lng },
           countryName: countryComponent?.long_name,
           countryCode: countryComponent?.short_name,
         };
+        this.setCached(this.geocodeCache, cacheKey, result);
+        return { ...result, location: { lat: location.lat, lng: location.lng } };
       }
       return { location: null };
     } catch (error) {
@@ -59,6 +96,12 @@ class GeocodingService {
   }
 
   async reverseGeocode(lat: number, lng: number): Promise<string | null> {
+    const cacheKey = `${lat.toFixed(5)},${lng.toFixed(5)}`;
+    const cached = this.getCached(this.reverseGeocodeCache, cacheKey);
+    if (cached !== undefined) {
+      return cached;
+    }
+
     try {
       const response = await this.client.reverseGeocode({
         params: {
@@ -68,7 +111,9 @@ class GeocodingService {
       });
 
       if (response.data.results && response.data.results.length > 0) {
-        return response.data.results[0].formatted_address;
+        const address = response.data.results[0].formatted_address;
+        this.setCached(this.reverseGeocodeCache, cacheKey, address);
+        return address;
       }
       return null;
     } catch (error) {
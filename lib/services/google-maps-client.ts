@@ -0,0 +1,12 @@
+import { Client } from "@googlemaps/google-maps-services-js";
+
+// One Maps client per process so geocoding and places calls share the
+// library's keep-alive agent instead of each service holding its own client.
+let googleMapsClientInstance: Client | null = null;
+
+export function getGoogleMapsClient(): Client {
+  if (!googleMapsClientInstance) {
+    googleMapsClientInstance = new Client({});
+  }
+  return googleMapsClientInstance;
+}
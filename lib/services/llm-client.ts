@@ -32,12 +32,60 @@ import { mergeResearchBriefAndSelections } from "./card-merging";
 import { formatTripPreferenceSummary, getTripFoodPreferences } from "@/lib/utils/trip-preferences";
 import { buildDayCapacityProfiles } from "@/lib/services/day-grouping/utils";
 import { toClockLabel } from "@/lib/utils/timeline-utils";
+import { takeRecentConversation } from "@/lib/utils/conversation-window";
+import {
+  createCircuitBreakerState,
+  recordCircuitFailure,
+  recordCircuitSuccess,
+  releaseCircuitProbe,
+  tryEnterCircuit,
+  type CircuitBreakerOptions,
+  type CircuitBreakerState,
+} from "@/lib/utils/circuit-breaker";
 
 const DEFAULT_MODEL = "gpt-4o";
 const DEFAULT_TEMPERATURE = 0.5;
 const RESEARCH_CATEGORIES = ["snorkeling", "hiking", "food", "culture", "relaxation", "adventure", "other"] as const;
 const ROUTES_API_URL = "https://routes.googleapis.com/directions/v2:computeRoutes";
 const ROUTE_WAYPOINT_CORRIDOR_METERS = 3000;
+const ROUTE_DEBUG_ENABLED = process.env.NODE_ENV !== "production";
+const TIME_OF_DAY_SOURCE_KEYWORDS: Record<"morning" | "afternoon" | "evening", readonly string[]> = {
+  morning: ["morning", "early", "sunrise", "calm", "before noon"],
+  afternoon: ["afternoon", "midday", "noon"],
+  evening: ["evening", "sunset", "night"],
+};
+const PLACE_MATCH_STOPWORDS = new Set([
+  "the",
+  "and",
+  "of",
+  "in",
+  "on",
+  "for",
+  "to",
+  "a",
+  "an",
+  "at",
+  "with",
+  "tour",
+  "trip",
+  "experience",
+  "class",
+  "activity",
+  "ticket",
+  "adventure",
+  "snorkel",
+  "snorkeling",
+  "hike",
+  "hiking",
+  "beach",
+  "bay",
+  "park",
+  "trail",
+  "drive",
+  "road",
+]);
+const JSON_CODE_FENCE_OPEN_PATTERN = /^```(?:json)?\s*/i;
+const JSON_CODE_FENCE_CLOSE_PATTERN = /```$/;
 
 const RESEARCH_RESPONSE_JSON_SCHEMA: Record<string, unknown> = {
   type: "object",
@@ -838,6 +886,25 @@ interface ConversationMessage {
   content: string;
 }
 
+type TravelSearchKind = "accommodation" | "flight";
+
+function isOpenAIOutageError(error: unknown): boolean {
+  if (error instanceof OpenAI.APIConnectionError || error instanceof OpenAI.APIConnectionTimeoutError) {
+    return true;
+  }
+  if (error instanceof OpenAI.APIError) {
+    const status = error.status;
+    return status === 429 || (typeof status === "number" && status >= 500);
+  }
+  return false;
+}
+
+interface TravelSearchCacheEntry<T> {
+  cachedAt: number;
+  message: string;
+  options: T[];
+}
+
 
 
 class LLMClient {
@@ -846,6 +913,19 @@ class LLMClient {
   private webSearchModel: string;
   private temperature: number;
   private webSearchSupportedInChat = true;
+  private flightSearchCache = new Map<string, TravelSearchCacheEntry<FlightOption>>();
+  private accommodationSearchCache = new Map<string, TravelSearchCacheEntry<AccommodationOption>>();
+  private readonly travelSearchCacheTtlMs = 1000 * 60 * 10;
+  private readonly travelSearchCacheMaxEntries = 256;
+  // Separate breakers so an outage in one search kind doesn't block the other.
+  private travelSearchCircuits: Record<TravelSearchKind, CircuitBreakerState> = {
+    accommodation: createCircuitBreakerState(),
+    flight: createCircuitBreakerState(),
+  };
+  private readonly travelSearchCircuitOptions: CircuitBreakerOptions = {
+    failureThreshold: 3,
+    cooldownMs: 1000 * 30,
+  };
 
   constructor(options: LLMClientOptions = {}) {
     const apiKey = process.env.LLM_API_KEY || process.env.OPENAI_API_KEY;
@@ -1267,10 +1347,25 @@ class LLMClient {
 
   private _asRoutePoints(value: unknown): Array<{ lat: number; lng: number }> {
     if (!Array.isArray(value)) return [];
-    return value
-      .map((entry) => this._asCoordinates(entry))
-      .filter((entry): entry is { lat: number; lng: number } => Boolean(entry))
-      .slice(0, 50);
+    const points: Array<{ lat: number; lng: number }> = [];
+    for (const entry of value) {
+      const point = this._asCoordinates(entry);
+      if (!point) continue;
+      points.push(point);
+      if (points.length === 50) break;
+    }
+    return points;
+  }
+
+  private _takeStrings(value: unknown, limit: number): string[] {
+    if (!Array.isArray(value)) return [];
+    const strings: string[] = [];
+    for (const entry of value) {
+      if (typeof entry !== "string") continue;
+      strings.push(entry);
+      if (strings.length === limit) break;
+    }
+    return strings;
   }
 
   private _asRouteWaypoints(value: unknown): RouteWaypoint[] {
@@ -1299,7 +1394,7 @@ class LLMClient {
     const x =
       Math.sin(dLat / 2) * Math.sin(dLat / 2) +
       Math.cos(lat1) * Math.cos(lat2) * Math.sin(dLng / 2) * Math.sin(dLng / 2);
-    return 2 * r * Math.atan2(Math.sqrt(x), Math.sqrt(1 - x));
+    return 2 * r * Math.asin(Math.min(1, Math.sqrt(x)));
   }
 
   private _getRoutesApiKey(): string | null {
@@ -1429,11 +1524,13 @@ class LLMClient {
     }
   }
 
-  private _logRouteDebug(label: string, payload: Record<string, unknown>) {
-    if (process.env.NODE_ENV === "production") return;
-    console.info(`[route-debug] ${label}`, payload);
+  // Payloads are built lazily so production requests skip the per-place mapping entirely.
+  private _logRouteDebug(label: string, buildPayload: () => Record<string, unknown>) {
+    if (!ROUTE_DEBUG_ENABLED) return;
+    console.info(`[route-debug] ${label}`, buildPayload());
   }
 
+
   private _buildRoutePointSequence({
     entryPoint,
     exitPoint,
@@ -1558,7 +1655,7 @@ class LLMClient {
       ...(exitPoint ? [{ name: "Route end", place_id: null, coordinates: exitPoint }] : []),
     ];
     const routePoints = this._buildRoutePointSequence({ entryPoint, exitPoint, waypoints: intermediateWaypoints });
-    this._logRouteDebug("buildRouteFromPlaces", {
+    this._logRouteDebug("buildRouteFromPlaces", () => ({
       optionTitle,
       destinationName,
       isLoop,
@@ -1574,7 +1671,7 @@ class LLMClient {
         coordinates: waypoint.coordinates,
       })),
       routePointCount: routePoints.length,
-    });
+    }));
     return { routeWaypoints, routePoints };
   }
 
@@ -1593,75 +1690,46 @@ class LLMClient {
         .replace(/\s+/g, " ")
         .trim();
 
-    const stopwords = new Set([
-      "the",
-      "and",
-      "of",
-      "in",
-      "on",
-      "for",
-      "to",
-      "a",
-      "an",
-      "at",
-      "with",
-      "tour",
-      "trip",
-      "experience",
-      "class",
-      "activity",
-      "ticket",
-      "adventure",
-      "snorkel",
-      "snorkeling",
-      "hike",
-      "hiking",
-      "beach",
-      "bay",
-      "park",
-      "trail",
-      "drive",
-      "road",
-    ]);
-
-    const titleTokens = normalize(optionTitle)
+    const normalizedTitle = normalize(optionTitle);
+    const titleTokens = normalizedTitle
       .split(" ")
-      .filter((token) => token.length >= 3 && !stopwords.has(token));
+      .filter((token) => token.length >= 3 && !PLACE_MATCH_STOPWORDS.has(token));
     const strongTokens = titleTokens.filter((token) => token.length >= 5);
     const destinationTokens = [destinationName, countryName]
       .filter((value): value is string => Boolean(value))
       .map((value) => normalize(value))
       .filter(Boolean);
 
-    const scored = places
-      .map((place) => {
-        const haystack = normalize(`${place.name || ""} ${place.vicinity || ""}`);
-        const name = normalize(place.name || "");
-
-        // Require at least one strong title token if we have any.
-        if (strongTokens.length > 0 && !strongTokens.some((token) => haystack.includes(token))) {
-          return null;
-        }
+    // Track the top-scoring candidate in one pass; ties keep the earlier (higher-ranked) result.
+    let bestPlace: (typeof places)[number] | null = null;
+    let bestScore = Number.NEGATIVE_INFINITY;
+    for (const place of places) {
+      const haystack = normalize(`${place.name || ""} ${place.vicinity || ""}`);
+      const name = normalize(place.name || "");
 
-        let score = 0;
-        if (name && name === normalize(optionTitle)) score += 6;
-        if (name && name.includes(normalize(optionTitle))) score += 4;
+      // Require at least one strong title token if we have any.
+      if (strongTokens.length > 0 && !strongTokens.some((token) => haystack.includes(token))) {
+        continue;
+      }
 
-        titleTokens.forEach((token) => {
-          if (haystack.includes(token)) score += 2;
-        });
-        destinationTokens.forEach((token) => {
-          if (haystack.includes(token)) score += 1;
-        });
+      let score = 0;
+      if (name && name === normalizedTitle) score += 6;
+      if (name && name.includes(normalizedTitle)) score += 4;
 
-        return { place, score };
-      })
-      .filter((value): value is { place: (typeof places)[number]; score: number } => Boolean(value));
+      titleTokens.forEach((token) => {
+        if (haystack.includes(token)) score += 2;
+      });
+      destinationTokens.forEach((token) => {
+        if (haystack.includes(token)) score += 1;
+      });
 
-    if (scored.length === 0) return places[0];
+      if (score > bestScore) {
+        bestScore = score;
+        bestPlace = place;
+      }
+    }
 
-    scored.sort((a, b) => b.score - a.score);
-    return scored[0].place;
+    return bestPlace ?? places[0];
   }
 
   private _inferLocationMode(option: { title: string; category: string }): "point" | "route" | "area" {
@@ -1895,14 +1963,10 @@ class LLMClient {
     if (!sourceLinks.length) return [];
     if (bestTimeOfDay === "any") return sourceLinks.slice(0, 2);
 
-    const keywords: Record<"morning" | "afternoon" | "evening", string[]> = {
-      morning: ["morning", "early", "sunrise", "calm", "before noon"],
-      afternoon: ["afternoon", "midday", "noon"],
-      evening: ["evening", "sunset", "night"],
-    };
+    const keywords = TIME_OF_DAY_SOURCE_KEYWORDS[bestTimeOfDay];
     const matched = sourceLinks.filter((link) => {
       const text = `${link.title} ${link.snippet || ""}`.toLowerCase();
-      return keywords[bestTimeOfDay].some((keyword) => text.includes(keyword));
+      return keywords.some((keyword) => text.includes(keyword));
     });
 
     return (matched.length > 0 ? matched : sourceLinks).slice(0, 2);
@@ -2055,7 +2119,7 @@ class LLMClient {
             preferTextSearch: true,
             region: destinationCountryCode ? destinationCountryCode.toLowerCase() : undefined,
           };
-          this._logRouteDebug("placeSearchContext", {
+          this._logRouteDebug("placeSearchContext", () => ({
             optionTitle: option.title,
             destinationName,
             destinationCoords,
@@ -2063,7 +2127,7 @@ class LLMClient {
             destinationCountryCode: destinationCountryCode || null,
             searchQuery,
             textSearchOptions,
-          });
+          }));
 
           console.log(`[Research-Enrich] Searching for: "${searchQuery}" (Region: ${textSearchOptions.region})`);
 
@@ -2074,7 +2138,7 @@ class LLMClient {
             null,
             textSearchOptions
           );
-          this._logRouteDebug("placeSearchResults", {
+          this._logRouteDebug("placeSearchResults", () => ({
             optionTitle: option.title,
             attempt: "primary",
             resultCount: places.length,
@@ -2085,7 +2149,7 @@ class LLMClient {
               location: place.location || null,
               types: place.types || [],
             })),
-          });
+          }));
 
           if (places.length > 0) {
             console.log(`[Research-Enrich] Found ${places.length} results for "${option.title}". Best match: "${places[0].name}"`);
@@ -2094,7 +2158,7 @@ class LLMClient {
           }
           if (!places.length && destinationCoords) {
             places = await placesClient.searchPlaces(searchQuery, destinationCoords, 500000, null, textSearchOptions);
-            this._logRouteDebug("placeSearchResults", {
+            this._logRouteDebug("placeSearchResults", () => ({
               optionTitle: option.title,
               attempt: "expanded",
               resultCount: places.length,
@@ -2105,11 +2169,11 @@ class LLMClient {
                 location: place.location || null,
                 types: place.types || [],
               })),
-            });
+            }));
           }
           if (!places.length) {
             places = await placesClient.searchPlaces(searchQuery, null, 5000, null, textSearchOptions);
-            this._logRouteDebug("placeSearchResults", {
+            this._logRouteDebug("placeSearchResults", () => ({
               optionTitle: option.title,
               attempt: "global",
               resultCount: places.length,
@@ -2120,7 +2184,7 @@ class LLMClient {
                 location: place.location || null,
                 types: place.types || [],
               })),
-            });
+            }));
           }
 
           if (!places.length && option.title.includes(" ")) {
@@ -2137,7 +2201,7 @@ class LLMClient {
               );
               if (!places.length && destinationCoords) {
                 places = await placesClient.searchPlaces(cleanedQuery, destinationCoords, 500000, null, textSearchOptions);
-                this._logRouteDebug("placeSearchResults", {
+                this._logRouteDebug("placeSearchResults", () => ({
                   optionTitle: option.title,
                   attempt: "cleaned-expanded",
                   resultCount: places.length,
@@ -2148,11 +2212,11 @@ class LLMClient {
                     location: place.location || null,
                     types: place.types || [],
                   })),
-                });
+                }));
               }
               if (!places.length) {
                 places = await placesClient.searchPlaces(cleanedQuery, null, 5000, null, textSearchOptions);
-                this._logRouteDebug("placeSearchResults", {
+                this._logRouteDebug("placeSearchResults", () => ({
                   optionTitle: option.title,
                   attempt: "cleaned-global",
                   resultCount: places.length,
@@ -2163,7 +2227,7 @@ class LLMClient {
                     location: place.location || null,
                     types: place.types || [],
                   })),
-                });
+                }));
               }
             }
           }
@@ -2182,7 +2246,7 @@ class LLMClient {
               );
               if (!places.length && destinationCoords) {
                 places = await placesClient.searchPlaces(shortQuery, destinationCoords, 500000, null, textSearchOptions);
-                this._logRouteDebug("placeSearchResults", {
+                this._logRouteDebug("placeSearchResults", () => ({
                   optionTitle: option.title,
                   attempt: "short-expanded",
                   resultCount: places.length,
@@ -2193,11 +2257,11 @@ class LLMClient {
                     location: place.location || null,
                     types: place.types || [],
                   })),
-                });
+                }));
               }
               if (!places.length) {
                 places = await placesClient.searchPlaces(shortQuery, null, 5000, null, textSearchOptions);
-                this._logRouteDebug("placeSearchResults", {
+                this._logRouteDebug("placeSearchResults", () => ({
                   optionTitle: option.title,
                   attempt: "short-global",
                   resultCount: places.length,
@@ -2208,13 +2272,13 @@ class LLMClient {
                     location: place.location || null,
                     types: place.types || [],
                   })),
-                });
+                }));
               }
             }
           }
 
           const preferredPlace = this._pickBestPlace(places, option.title, destinationName, destinationCountryName);
-          this._logRouteDebug("placeSearchSelection", {
+          this._logRouteDebug("placeSearchSelection", () => ({
             optionTitle: option.title,
             destinationName,
             destinationCountryName: destinationCountryName || null,
@@ -2227,7 +2291,7 @@ class LLMClient {
               }
               : null,
             candidateCount: places.length,
-          });
+          }));
           const placeId = preferredPlace?.place_id || null;
           let routeWaypoints = option.routeWaypoints || [];
           let routePoints = option.routePoints || [];
@@ -2242,12 +2306,12 @@ class LLMClient {
               });
               startCoordinates = startCoordinates || derived.startCoordinates;
               endCoordinates = endCoordinates || derived.endCoordinates;
-              this._logRouteDebug("derivedRouteEndpoints", {
+              this._logRouteDebug("derivedRouteEndpoints", () => ({
                 optionId: option.id,
                 optionTitle: option.title,
                 startCoordinates,
                 endCoordinates,
-              });
+              }));
             }
 
             const builtRoute = await this._buildRouteFromPlaces({
@@ -2272,14 +2336,14 @@ class LLMClient {
               });
             }
 
-            this._logRouteDebug("finalRoutePayload", {
+            this._logRouteDebug("finalRoutePayload", () => ({
               optionId: option.id,
               optionTitle: option.title,
               waypointCount: routeWaypoints.length,
               routePointCount: routePoints.length,
               entryPoint: startCoordinates,
               exitPoint: endCoordinates,
-            });
+            }));
           }
 
           if (!placeId) {
@@ -2969,7 +3033,7 @@ class LLMClient {
         researchOptionSelections: state.researchOptionSelections,
       }),
       openQuestions: state.tripResearchBrief.openQuestions || [],
-      recentConversation: conversationHistory.slice(-10),
+      recentConversation: takeRecentConversation(conversationHistory, 10),
       userMessage,
     });
 
@@ -3233,7 +3297,7 @@ class LLMClient {
     const a =
       Math.sin(dLat / 2) * Math.sin(dLat / 2) +
       Math.cos(toRad(from.lat)) * Math.cos(toRad(to.lat)) * Math.sin(dLng / 2) * Math.sin(dLng / 2);
-    const c = 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a));
+    const c = 2 * Math.asin(Math.min(1, Math.sqrt(a)));
     return earthRadiusKm * c;
   }
 
@@ -3404,8 +3468,7 @@ class LLMClient {
         messages: [
           {
             role: "system",
-            content:
-              "You are a principal travel-planning reviewer. Respond in plain text only. Be concise and high-signal. Focus only on the most important findings for decision-making right now. Do not recap each day or narrate the itinerary chronologically unless a critical issue depends on specific day sequencing. Prefer 3-5 short bullets total. Each bullet should be one key issue, risk, or recommendation. Avoid filler, repetition, and obvious statements. Treat provided timing/commute estimates as approximate but actionable for identifying overloaded days, long transfers, and sequencing risks. For overload judgments, prioritize totalEffectivePlannedHours over raw totalPlannedHours and treat off-hours one-off activities as discounted load. If a day clearly still has free capacity before evening, do not call it overloaded. If there are no meaningful issues, say exactly: Everything looks good.",
+            content: SYSTEM_PROMPTS.AI_CHECK,
           },
           {
             role: "user",
@@ -3415,40 +3478,40 @@ Workflow state:
 ${workflowState}
 
 Trip info:
-${JSON.stringify(tripInfo, null, 2)}
+${JSON.stringify(tripInfo)}
 
 Suggested activities:
-${JSON.stringify(suggestedActivities, null, 2)}
+${JSON.stringify(suggestedActivities)}
 
 Selected activity IDs:
-${JSON.stringify(selectedActivityIds, null, 2)}
+${JSON.stringify(selectedActivityIds)}
 
 Day groups:
-${JSON.stringify(dayGroups, null, 2)}
+${JSON.stringify(dayGroups)}
 
 Grouped days:
-${JSON.stringify(groupedDays, null, 2)}
+${JSON.stringify(groupedDays)}
 
 Derived day timing and commute summary (approximate):
-${JSON.stringify(dayTimingSummary, null, 2)}
+${JSON.stringify(dayTimingSummary)}
 
 Restaurant suggestions:
-${JSON.stringify(restaurantSuggestions, null, 2)}
+${JSON.stringify(restaurantSuggestions)}
 
 Selected restaurant IDs:
-${JSON.stringify(selectedRestaurantIds, null, 2)}
+${JSON.stringify(selectedRestaurantIds)}
 
 Selected accommodation:
-${JSON.stringify(selectedAccommodation, null, 2)}
+${JSON.stringify(selectedAccommodation)}
 
 Selected flight:
-${JSON.stringify(selectedFlight, null, 2)}
+${JSON.stringify(selectedFlight)}
 
 Accommodation decision/status:
-${JSON.stringify({ wantsAccommodation, accommodationStatus }, null, 2)}
+${JSON.stringify({ wantsAccommodation, accommodationStatus })}
 
 Flight decision/status:
-${JSON.stringify({ wantsFlight, flightStatus }, null, 2)}`,
+${JSON.stringify({ wantsFlight, flightStatus })}`,
           },
         ],
       });
@@ -3548,13 +3611,13 @@ ${JSON.stringify({
           durationDays: tripInfo.durationDays,
           activityLevel: tripInfo.activityLevel,
           preferences: tripInfo.preferences || [],
-        }, null, 2)}
+        })}
 
 Target day count: ${dayCount}
 Day dates: ${JSON.stringify(normalizedDates)}
 
 Activities:
-${JSON.stringify(activityPayload, null, 2)}`,
+${JSON.stringify(activityPayload)}`,
       },
     ];
 
@@ -3827,46 +3890,8 @@ ${JSON.stringify(activityPayload, null, 2)}`,
     currentCost: number;
     allowDurationShrinking: boolean;
   }): DayGroupingRefinementMessage[] {
-    const systemPrompt = `You are improving upon a travel itinerary that might be suboptimal in several ways, including empty days without a plan, overloaded days, too much driving, activies that can be scheduled but are not, etc. Please use your judgement to suggest some logical improvements to the itinerary using the operations and guidelines below.
-Return ONLY JSON:
-{
-  "operations": [
-    {
-      "type": "move | reorder_activities | set_night_stay | no_op",
-      "...": "operation fields"
-    }
-  ]
-}
-
-Allowed operations:
-1) move(dayNumber, activityIds, insertIndex?)
-   - Moves each activity from wherever it currently is into the target day.
-   - Use dayNumber: 0 to move activities into the Unassigned bucket.
-2) reorder_activities(dayNumber, activityIds)
-   - Reorders the activities already scheduled on that day.
-   - activityIds must be the full ordered list for that day after reordering.
-   - Do not use this to move activities between days or to/from Unassigned.
-3) set_night_stay(dayNumber, label, notes?)
-4) no_op(reason?)
-
-Rules:
-- no_op should appear only when no meaningful improvement is likely.
-- Never invent activity IDs.
-- Use activity IDs from the payload as references; names are provided only for readability.
-- Only use day numbers that exist.
-- dayNumber 0 is reserved for the Unassigned bucket.
-- Treat day timing/capacity constraints as hard feasibility signals, not optional preferences.
-- Use scheduledActivities as the authoritative current intra-day order and timing for the existing plan.
-- When only the order inside one day should change, prefer reorder_activities over move.
-- Consider intraday reordering when it can reduce commute, fix timing conflicts, or better respect fixed starts and recommended windows.
-- On an arrival day, do not move activities that would need to start before the earliestStart constraint; move them to dayNumber 0 or choose no_op if they cannot fit.
-- On a departure day, do not move activities that would need to end after the latestEnd constraint; move them to dayNumber 0 or choose no_op if they cannot fit.
-- Preserve fixed-time or narrow-window activities only when the target day can honor their time window.
-- If allowDurationShrinking is false, do not rely on shortening visit durations; keep visits near recommended durations.
-- If no likely improvement exists, return one operation: [{"type":"no_op","reason":"..."}].`;
-
     return [
-      { role: "system", content: systemPrompt },
+      { role: "system", content: SYSTEM_PROMPTS.DAY_GROUPING_REFINEMENT },
       {
         role: "user",
         content: `Trip info:
@@ -3882,24 +3907,24 @@ ${JSON.stringify({
           arrivalTimePreference: tripInfo.arrivalTimePreference,
           departureTimePreference: tripInfo.departureTimePreference,
           allowDurationShrinking,
-        }, null, 2)}
+        })}
 
 Current cost: ${currentCost}
 
 Day timing/capacity constraints:
-${JSON.stringify(payload.dayConstraintsPayload, null, 2)}
+${JSON.stringify(payload.dayConstraintsPayload)}
 
 Days:
-${JSON.stringify(payload.dayPayload, null, 2)}
+${JSON.stringify(payload.dayPayload)}
 
 Unassigned activity IDs:
-${JSON.stringify(unassignedActivityIds, null, 2)}
+${JSON.stringify(unassignedActivityIds)}
 
 Unassigned activities:
-${JSON.stringify(payload.unassignedActivitiesPayload, null, 2)}
+${JSON.stringify(payload.unassignedActivitiesPayload)}
 
 All activities:
-${JSON.stringify(payload.allActivities, null, 2)}`,
+${JSON.stringify(payload.allActivities)}`,
       },
     ];
   }
@@ -3920,8 +3945,8 @@ ${JSON.stringify(payload.allActivities, null, 2)}`,
     try {
       const normalized = responseText
         .trim()
-        .replace(/^```(?:json)?\s*/i, "")
-        .replace(/```$/i, "")
+        .replace(JSON_CODE_FENCE_OPEN_PATTERN, "")
+        .replace(JSON_CODE_FENCE_CLOSE_PATTERN, "")
         .trim();
       const parsedResponse = JSON.parse(normalized);
       return this.parseDayGroupingRefinementOperations(parsedResponse);
@@ -3977,13 +4002,13 @@ Preferences: ${formatTripPreferenceSummary(tripInfo)}
 ${getTripFoodPreferences(tripInfo).length > 0 ? `Food context: ${getTripFoodPreferences(tripInfo).join(", ")}\n` : ""}
 
 Selected accommodation:
-${selectedAccommodation ? JSON.stringify(selectedAccommodation, null, 2) : "None"}
+${selectedAccommodation ? JSON.stringify(selectedAccommodation) : "None"}
 
 Accommodation availability by area:
-${availabilitySummary ? JSON.stringify(availabilitySummary, null, 2) : "None"}
+${availabilitySummary ? JSON.stringify(availabilitySummary) : "None"}
 
 Day plan:
-${JSON.stringify(daysPayload, null, 2)}`,
+${JSON.stringify(daysPayload)}`,
     });
 
     try {
@@ -4020,9 +4045,11 @@ ${JSON.stringify(daysPayload, null, 2)}`,
   async searchAccommodationOffers({
     tripInfo,
     selectedActivities,
+    forceRefresh = false,
   }: {
     tripInfo: TripInfo;
     selectedActivities: SuggestedActivity[];
+    forceRefresh?: boolean;
   }): Promise<{
     success: boolean;
     message: string;
@@ -4040,6 +4067,22 @@ ${JSON.stringify(daysPayload, null, 2)}`,
       .slice(0, 8)
       .map((activity) => `${activity.name}${activity.neighborhood ? ` (${activity.neighborhood})` : ""}`)
       .join(", ");
+    const preferenceSummary = formatTripPreferenceSummary(tripInfo, "General");
+    const foodPreferences = getTripFoodPreferences(tripInfo);
+
+    const cacheKey = this.buildTravelSearchCacheKey(tripInfo, preferenceSummary, foodPreferences, activityHints);
+    const cached = forceRefresh ? undefined : this.getCachedTravelSearch(this.accommodationSearchCache, cacheKey);
+    if (cached) {
+      return { success: true, ...cached };
+    }
+
+    if (!this.tryEnterTravelSearchCircuit("accommodation")) {
+      return {
+        success: false,
+        message: "Accommodation search is temporarily unavailable. Please try again shortly.",
+        options: [],
+      };
+    }
 
     const input = `Find up-to-date accommodation options for this trip using web search.
 
@@ -4050,8 +4093,8 @@ Trip:
 - Dates: ${tripInfo.startDate} to ${tripInfo.endDate}
 - Travelers: ${tripInfo.travelers}
 - Budget: ${tripInfo.budget || "Not specified"}
-- Preferences: ${formatTripPreferenceSummary(tripInfo, "General")}
-${getTripFoodPreferences(tripInfo).length > 0 ? `- Food context: ${getTripFoodPreferences(tripInfo).join(", ")}\n` : ""}- Selected activities for area relevance: ${activityHints || "None provided"}
+- Preferences: ${preferenceSummary}
+${foodPreferences.length > 0 ? `- Food context: ${foodPreferences.join(", ")}\n` : ""}- Selected activities for area relevance: ${activityHints || "None provided"}
 
 Rules:
 - Focus on options realistically bookable for these dates.
@@ -4089,24 +4132,25 @@ Rules:
           rating: typeof option.rating === "number" ? option.rating : null,
           sourceUrl: typeof option.sourceUrl === "string" ? option.sourceUrl : null,
           summary: typeof option.summary === "string" ? option.summary : "",
-          pros: Array.isArray(option.pros)
-            ? option.pros.filter((value): value is string => typeof value === "string").slice(0, 4)
-            : [],
-          cons: Array.isArray(option.cons)
-            ? option.cons.filter((value): value is string => typeof value === "string").slice(0, 4)
-            : [],
+          pros: this._takeStrings(option.pros, 4),
+          cons: this._takeStrings(option.cons, 4),
         };
       });
 
+      const message =
+        typeof parsed.message === "string" && parsed.message.trim()
+          ? parsed.message
+          : `Found ${options.length} accommodation options for ${tripInfo.destination}.`;
+      this.setCachedTravelSearch(this.accommodationSearchCache, cacheKey, message, options);
+      this.recordTravelSearchOutcome("accommodation");
+
       return {
         success: true,
-        message:
-          typeof parsed.message === "string" && parsed.message.trim()
-            ? parsed.message
-            : `Found ${options.length} accommodation options for ${tripInfo.destination}.`,
+        message,
         options,
       };
     } catch (error) {
+      this.recordTravelSearchOutcome("accommodation", error);
       console.error("Error in searchAccommodationOffers:", error);
       return {
         success: false,
@@ -4116,12 +4160,88 @@ Rules:
     }
   }
 
+  private tryEnterTravelSearchCircuit(kind: TravelSearchKind): boolean {
+    return tryEnterCircuit(this.travelSearchCircuits[kind], this.travelSearchCircuitOptions);
+  }
+
+  // Only transport and upstream API failures count toward the breaker; a malformed model
+  // response fails that one request but says nothing about whether the API is healthy.
+  private recordTravelSearchOutcome(kind: TravelSearchKind, error?: unknown): void {
+    const circuit = this.travelSearchCircuits[kind];
+    if (error === undefined) {
+      recordCircuitSuccess(circuit);
+    } else if (isOpenAIOutageError(error)) {
+      recordCircuitFailure(circuit, this.travelSearchCircuitOptions);
+    } else {
+      releaseCircuitProbe(circuit);
+    }
+  }
+
+  private buildTravelSearchCacheKey(
+    tripInfo: TripInfo,
+    preferenceSummary: string,
+    foodPreferences: string[],
+    activityHints: string
+  ): string {
+    const normalize = (value: string | null | undefined) => (value || "").trim().toUpperCase();
+    return JSON.stringify({
+      model: this.model,
+      source: normalize(tripInfo.source),
+      destination: normalize(tripInfo.destination),
+      startDate: tripInfo.startDate,
+      endDate: tripInfo.endDate,
+      travelers: tripInfo.travelers,
+      budget: tripInfo.budget || null,
+      preferences: preferenceSummary,
+      foodPreferences,
+      activityHints,
+    });
+  }
+
+  private getCachedTravelSearch<T>(
+    cache: Map<string, TravelSearchCacheEntry<T>>,
+    cacheKey: string
+  ): { message: string; options: T[] } | undefined {
+    const entry = cache.get(cacheKey);
+    if (!entry) return undefined;
+    if (Date.now() - entry.cachedAt > this.travelSearchCacheTtlMs) {
+      cache.delete(cacheKey);
+      return undefined;
+    }
+    // Re-insert on hit so eviction drops the least recently used search, not the oldest one.
+    cache.delete(cacheKey);
+    cache.set(cacheKey, entry);
+    return { message: entry.message, options: structuredClone(entry.options) };
+  }
+
+  private setCachedTravelSearch<T>(
+    cache: Map<string, TravelSearchCacheEntry<T>>,
+    cacheKey: string,
+    message: string,
+    options: T[]
+  ): void {
+    // An empty result is usually a transient miss; let the next request search again.
+    if (options.length === 0) return;
+    cache.delete(cacheKey);
+    if (cache.size >= this.travelSearchCacheMaxEntries) {
+      const oldestKey = cache.keys().next().value;
+      if (oldestKey !== undefined) cache.delete(oldestKey);
+    }
+    cache.set(cacheKey, {
+      cachedAt: Date.now(),
+      message,
+      options: structuredClone(options),
+    });
+  }
+
   async searchFlightOffers({
     tripInfo,
     selectedActivities,
+    forceRefresh = false,
   }: {
     tripInfo: TripInfo;
     selectedActivities: SuggestedActivity[];
+    forceRefresh?: boolean;
   }): Promise<{
     success: boolean;
     message: string;
@@ -4140,6 +4260,22 @@ Rules:
       .map((activity) => activity.name)
       .join(", ");
 
+    const preferenceSummary = formatTripPreferenceSummary(tripInfo, "General");
+    const foodPreferences = getTripFoodPreferences(tripInfo);
+    const cacheKey = this.buildTravelSearchCacheKey(tripInfo, preferenceSummary, foodPreferences, activityHints);
+    const cached = forceRefresh ? undefined : this.getCachedTravelSearch(this.flightSearchCache, cacheKey);
+    if (cached) {
+      return { success: true, ...cached };
+    }
+
+    if (!this.tryEnterTravelSearchCircuit("flight")) {
+      return {
+        success: false,
+        message: "Flight search is temporarily unavailable. Please try again shortly.",
+        options: [],
+      };
+    }
+
     const input = `Find up-to-date flight options for this trip using web search.
 
 Return exactly up to 5 options in JSON.
@@ -4149,8 +4285,8 @@ Trip:
 - Dates: ${tripInfo.startDate} to ${tripInfo.endDate}
 - Travelers: ${tripInfo.travelers}
 - Budget: ${tripInfo.budget || "Not specified"}
-- Preferences: ${formatTripPreferenceSummary(tripInfo, "General")}
-${getTripFoodPreferences(tripInfo).length > 0 ? `- Food context: ${getTripFoodPreferences(tripInfo).join(", ")}\n` : ""}- Planned activities context: ${activityHints || "None provided"}
+- Preferences: ${preferenceSummary}
+${foodPreferences.length > 0 ? `- Food context: ${foodPreferences.join(", ")}\n` : ""}- Planned activities context: ${activityHints || "None provided"}
 
 Rules:
 - Include realistic routes and fare estimates with source URLs where possible.
@@ -4193,15 +4329,20 @@ Rules:
         };
       });
 
+      const message =
+        typeof parsed.message === "string" && parsed.message.trim()
+          ? parsed.message
+          : `Found ${options.length} flight options for ${tripInfo.destination}.`;
+      this.setCachedTravelSearch(this.flightSearchCache, cacheKey, message, options);
+      this.recordTravelSearchOutcome("flight");
+
       return {
         success: true,
-        message:
-          typeof parsed.message === "string" && parsed.message.trim()
-            ? parsed.message
-            : `Found ${options.length} flight options for ${tripInfo.destination}.`,
+        message,
         options,
       };
     } catch (error) {
+      this.recordTravelSearchOutcome("flight", error);
       console.error("Error in searchFlightOffers:", error);
       return {
         success: false,
@@ -4362,7 +4503,7 @@ Activity level: ${tripInfo.activityLevel}
 Budget: ${tripInfo.budget || "Not specified"}
 
 Current option (preserve id and title):
-${JSON.stringify(option, null, 2)}
+${JSON.stringify(option)}
 
 Return one improved option with stronger evidence and date fit.`;
 
@@ -4536,13 +4677,13 @@ ${JSON.stringify({
       flightStatus: context.flightStatus,
       selectedAccommodation: context.selectedAccommodationOptionId,
       selectedFlight: context.selectedFlightOptionId,
-    }, null, 2)}
+    })}
 
 Working Itinerary (Grouped Days):
-${JSON.stringify(context.groupedDays, null, 2)}
+${JSON.stringify(context.groupedDays)}
 
-Recent Conversation (Last 5 messages):
-${JSON.stringify(conversationHistory.slice(-5), null, 2)}
+Recent Conversation (up to 5 most recent messages):
+${JSON.stringify(takeRecentConversation(conversationHistory, 5))}
 `;
 
     try {
@@ -60,7 +60,7 @@ function haversineDistanceKm(
   const h =
     Math.sin(dLat / 2) * Math.sin(dLat / 2) +
     Math.sin(dLng / 2) * Math.sin(dLng / 2) * Math.cos(lat1) * Math.cos(lat2);
-  const c = 2 * Math.atan2(Math.sqrt(h), Math.sqrt(1 - h));
+  const c = 2 * Math.asin(Math.min(1, Math.sqrt(h)));
   return r * c;
 }
 
@@ -95,18 +95,29 @@ function computeStayCentroid(activities: GroupedDay["activities"]): { lat: numbe
   return { lat: sumLat / count, lng: sumLng / count };
 }
 
+const activityNameCollator = new Intl.Collator();
+const DRIVE_TIME_OF_DAY_ORDER: Record<NonNullable<GroupedDay["activities"][number]["bestTimeOfDay"]>, number> = {
+  morning: 0,
+  afternoon: 1,
+  evening: 2,
+  any: 3,
+};
+
+function compareCandidateDriveScores(
+  a: NonNullable<NightStay["candidates"]>[number],
+  b: NonNullable<NightStay["candidates"]>[number]
+): number {
+  if (a.driveScoreKm == null) return b.driveScoreKm == null ? 0 : 1;
+  if (b.driveScoreKm == null) return -1;
+  return a.driveScoreKm - b.driveScoreKm;
+}
+
 function sortActivitiesForDrive(activities: GroupedDay["activities"]): GroupedDay["activities"] {
-  const score: Record<NonNullable<GroupedDay["activities"][number]["bestTimeOfDay"]>, number> = {
-    morning: 0,
-    afternoon: 1,
-    evening: 2,
-    any: 3,
-  };
   return [...activities].sort((a, b) => {
-    const aScore = score[a.bestTimeOfDay ?? "any"] ?? 3;
-    const bScore = score[b.bestTimeOfDay ?? "any"] ?? 3;
+    const aScore = DRIVE_TIME_OF_DAY_ORDER[a.bestTimeOfDay ?? "any"] ?? 3;
+    const bScore = DRIVE_TIME_OF_DAY_ORDER[b.bestTimeOfDay ?? "any"] ?? 3;
     if (aScore !== bScore) return aScore - bScore;
-    return a.name.localeCompare(b.name);
+    return activityNameCollator.compare(a.name, b.name);
   });
 }
 
@@ -117,22 +128,35 @@ function activityDrivePoint(activity: GroupedDay["activities"][number]): { lat:
   return activity.coordinates ?? activity.startCoordinates ?? activity.endCoordinates ?? null;
 }
 
+function buildDriveRoute(activities: GroupedDay["activities"]): {
+  points: Array<{ lat: number; lng: number }>;
+  internalKm: number;
+} {
+  const points = sortActivitiesForDrive(activities)
+    .map((activity) => activityDrivePoint(activity))
+    .filter((point): point is { lat: number; lng: number } => Boolean(point));
+  let internalKm = 0;
+  for (let i = 1; i < points.length; i += 1) {
+    internalKm += haversineDistanceKm(points[i - 1], points[i]);
+  }
+  return { points, internalKm };
+}
+
+// The activity-to-activity legs are the same for every stay candidate, so only the
+// legs out of and back to the stay are computed per candidate.
 function computeDriveScore(
   stay: { lat: number; lng: number } | null,
-  activities: GroupedDay["activities"]
+  route: ReturnType<typeof buildDriveRoute>
 ): number {
   if (!stay) return Number.POSITIVE_INFINITY;
-  const ordered = sortActivitiesForDrive(activities)
-    .map((activity) => activityDrivePoint(activity))
-    .filter((point): point is { lat: number; lng: number } => Boolean(point));
-  if (ordered.length === 0) return Number.POSITIVE_INFINITY;
+  const { points, internalKm } = route;
+  if (points.length === 0) return Number.POSITIVE_INFINITY;
 
-  let total = haversineDistanceKm(stay, ordered[0]);
-  for (let i = 1; i < ordered.length; i += 1) {
-    total += haversineDistanceKm(ordered[i - 1], ordered[i]);
-  }
-  total += haversineDistanceKm(ordered[ordered.length - 1], stay);
-  return total;
+  return (
+    haversineDistanceKm(stay, points[0]) +
+    internalKm +
+    haversineDistanceKm(points[points.length - 1], stay)
+  );
 }
 
 export async function assignNightStays({
@@ -160,10 +184,12 @@ export async function assignNightStays({
 
   if (!selectedAccommodation) {
     try {
-      // Find verified lodging areas for each day by querying Places API around the day's centroid
-      for (const day of groupedDays) {
-        const centroid = computeStayCentroid(day.activities) ?? computeActivitiesCentroid(day.activities);
-        if (centroid) {
+      // Find verified lodging areas for each day by querying Places API around the day's centroid.
+      // Days are independent, so the lookups run concurrently.
+      await Promise.all(
+        groupedDays.map(async (day) => {
+          const centroid = computeStayCentroid(day.activities) ?? computeActivitiesCentroid(day.activities);
+          if (!centroid) return;
           const places = await placesClient.searchPlaces("hotel", centroid, 15000, "lodging");
           const areas = new Set<string>();
           for (const place of places) {
@@ -179,8 +205,8 @@ export async function assignNightStays({
           if (areas.size > 0) {
             verifiedLodgingAreas[day.dayNumber] = Array.from(areas).slice(0, 5);
           }
-        }
-      }
+        })
+      );
 
       const llmClient = getLLMClient();
       const response = await llmClient.determineNightStays({
@@ -227,12 +253,13 @@ export async function assignNightStays({
     const scoredCandidates: NightStay["candidates"] = [];
 
     if (candidates.length > 0 && geocodingService) {
+      const driveRoute = buildDriveRoute(day.activities);
       const locationPromises = candidates.map(async (candidate) => {
         const query = tripInfo.destination
           ? `${candidate.label}, ${tripInfo.destination}`
           : candidate.label;
         const location = await geocodingService!.geocode(query);
-        const driveScore = computeDriveScore(location, day.activities);
+        const driveScore = computeDriveScore(location, driveRoute);
         return { candidate, location, driveScore };
       });
       const resolvedLocations = await Promise.all(locationPromises);
@@ -288,11 +315,7 @@ export async function assignNightStays({
       fallbackLabel,
     });
     if (scoredCandidates && scoredCandidates.length > 0) {
-      nightStay.candidates = scoredCandidates.sort((a, b) => {
-        const aScore = a.driveScoreKm ?? Number.POSITIVE_INFINITY;
-        const bScore = b.driveScoreKm ?? Number.POSITIVE_INFINITY;
-        return aScore - bScore;
-      });
+      nightStay.candidates = scoredCandidates.sort(compareCandidateDriveScores);
     }
     stayByDay.set(day.dayNumber, nightStay);
   }
@@ -148,6 +148,10 @@ const CULTURE_TYPES = new Set([
 const cache = new Map<string, CachedPlaceInfoEntry>();
 let cacheLoaded = false;
 const cacheTtlMs = 1000 * 60 * 60 * 24 * 90;
+const persistDebounceMs = 250;
+let persistTimer: ReturnType<typeof setTimeout> | null = null;
+let persistQueue: Promise<void> = Promise.resolve();
+let persistFlushRegistered = false;
 
 export function getPlaceInfoCachePath(): string {
   const basePath =
@@ -245,12 +249,38 @@ function loadCache(): void {
   }
 }
 
+// Coalesce bursts of cache updates (one per search result) into a single async write
+// so request handlers never block on rewriting the whole cache file. A write still waiting
+// on the debounce timer is flushed synchronously on process exit. A SIGKILL, or process.exit()
+// during an in-flight async write, can still lose the latest updates; the cache is rebuildable.
 function persistCache(): void {
-  try {
-    fs.writeFileSync(getPlaceInfoCachePath(), JSON.stringify(Object.fromEntries(cache), null, 2), "utf8");
-  } catch (error) {
-    console.warn("Failed to persist place info cache:", (error as Error).message);
-  }
+  if (persistTimer) return;
+  registerPersistFlushOnExit();
+  persistTimer = setTimeout(() => {
+    persistTimer = null;
+    const serialized = JSON.stringify(Object.fromEntries(cache), null, 2);
+    persistQueue = persistQueue
+      .then(() => fs.promises.writeFile(getPlaceInfoCachePath(), serialized, "utf8"))
+      .catch((error) => {
+        console.warn("Failed to persist place info cache:", (error as Error).message);
+      });
+  }, persistDebounceMs);
+}
+
+function registerPersistFlushOnExit(): void {
+  if (persistFlushRegistered) return;
+  persistFlushRegistered = true;
+  // "exit" handlers must be synchronous, and it fires for process.exit() as well as a normal exit.
+  process.once("exit", () => {
+    if (!persistTimer) return;
+    clearTimeout(persistTimer);
+    persistTimer = null;
+    try {
+      fs.writeFileSync(getPlaceInfoCachePath(), JSON.stringify(Object.fromEntries(cache), null, 2), "utf8");
+    } catch (error) {
+      console.warn("Failed to flush place info cache:", (error as Error).message);
+    }
+  });
 }
 
 function normalizeCachedPlaceInfo(info: unknown): CachedPlaceInfo | null {
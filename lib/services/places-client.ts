@@ -1,5 +1,6 @@
-import { Client } from "@googlemaps/google-maps-services-js";
+import type { Client } from "@googlemaps/google-maps-services-js";
 import type { Coordinates } from "@/lib/models/travel-plan";
+import { getGoogleMapsClient } from "@/lib/services/google-maps-client";
 import {
   buildCachedPlaceInfoFromPlaceDetails,
   buildCachedPlaceInfoFromSearchResult,
@@ -65,10 +66,13 @@ class PlacesClient {
   private client: Client;
   private apiKey: string;
   private placeSearchCache = new Map<string, PlaceSearchCacheEntry>();
+  private pendingPlaceSearches = new Map<string, Promise<PlaceResult[]>>();
+  private pendingPlaceDetails = new Map<string, Promise<PlaceDetails | null>>();
   private reverseGeocodeCache = new Map<string, ReverseGeocodeCacheEntry>();
   private readonly cacheTtlMs = 1000 * 60 * 60 * 24 * 30;
   private readonly searchCacheTtlMs = 1000 * 60 * 60 * 24 * 7;
   private readonly reverseGeocodeCacheVersion = 3;
+  private readonly cacheMaxEntries = 4096;
 
   constructor() {
     const rawApiKey = process.env.GOOGLE_PLACES_API_KEY || process.env.GOOGLE_GEOCODING_API_KEY;
@@ -81,7 +85,7 @@ class PlacesClient {
       throw new Error("GOOGLE_PLACES_API_KEY / GOOGLE_GEOCODING_API_KEY is empty after sanitation.");
     }
 
-    this.client = new Client({});
+    this.client = getGoogleMapsClient();
   }
 
   private buildPlaceDetailsFromCache(info: CachedPlaceInfo): PlaceDetails {
@@ -132,6 +136,21 @@ class PlacesClient {
     });
   }
 
+  // Maps iterate in insertion order, so re-inserting on a hit keeps the oldest key the least
+  // recently used one and lets the caches evict LRU-first once they reach cacheMaxEntries.
+  private touchCacheEntry<T>(cache: Map<string, T>, cacheKey: string, entry: T): void {
+    cache.delete(cacheKey);
+    cache.set(cacheKey, entry);
+  }
+
+  private makeRoomInCache<T>(cache: Map<string, T>, cacheKey: string): void {
+    cache.delete(cacheKey);
+    if (cache.size >= this.cacheMaxEntries) {
+      const oldestKey = cache.keys().next().value;
+      if (oldestKey !== undefined) cache.delete(oldestKey);
+    }
+  }
+
   private getCachedSearchResults(cacheKey: string): PlaceResult[] | undefined {
     const entry = this.placeSearchCache.get(cacheKey);
     if (!entry) return undefined;
@@ -139,10 +158,12 @@ class PlacesClient {
       this.placeSearchCache.delete(cacheKey);
       return undefined;
     }
+    this.touchCacheEntry(this.placeSearchCache, cacheKey, entry);
     return entry.results;
   }
 
   private setCachedSearchResults(cacheKey: string, results: PlaceResult[]): void {
+    this.makeRoomInCache(this.placeSearchCache, cacheKey);
     this.placeSearchCache.set(cacheKey, {
       cachedAt: Date.now(),
       results,
@@ -164,10 +185,12 @@ class PlacesClient {
       this.reverseGeocodeCache.delete(cacheKey);
       return undefined;
     }
+    this.touchCacheEntry(this.reverseGeocodeCache, cacheKey, entry);
     return entry.result;
   }
 
   private setCachedReverseGeocode(cacheKey: string, result: ReverseGeocodeResult | null): void {
+    this.makeRoomInCache(this.reverseGeocodeCache, cacheKey);
     this.reverseGeocodeCache.set(cacheKey, {
       cachedAt: Date.now(),
       result,
@@ -198,19 +221,41 @@ class PlacesClient {
       return cached;
     }
 
+    // Share one request between concurrent callers asking for the same search (e.g. repeated
+    // landmarks across research options) instead of paying a round-trip per duplicate.
+    const pending = this.pendingPlaceSearches.get(cacheKey);
+    if (pending) {
+      return pending;
+    }
+
+    const request = this.fetchSearchResults(cleanQuery, cacheKey, location, radius, placeType, options).finally(() => {
+      this.pendingPlaceSearches.delete(cacheKey);
+    });
+    this.pendingPlaceSearches.set(cacheKey, request);
+    return request;
+  }
+
+  private async fetchSearchResults(
+    cleanQuery: string,
+    cacheKey: string,
+    location: Coordinates | null,
+    radius: number,
+    placeType: string | null,
+    options: {
+      preferTextSearch?: boolean;
+      region?: string;
+    },
+  ): Promise<PlaceResult[]> {
     try {
       const useTextSearch = !location || options.preferTextSearch;
       if (useTextSearch) {
         const params: Record<string, unknown> = {
           key: this.apiKey,
           query: cleanQuery,
+          ...(placeType ? { type: placeType } : {}),
+          ...(location ? { location, radius } : {}),
+          ...(options.region ? { region: options.region } : {}),
         };
-        if (placeType) params.type = placeType;
-        if (location) {
-          params.location = location;
-          params.radius = radius;
-        }
-        if (options.region) params.region = options.region;
 
         const response = await this.client.textSearch({
           params: params as unknown as Parameters<typeof this.client.textSearch>[0]["params"],
@@ -226,8 +271,8 @@ class PlacesClient {
         location,
         radius,
         keyword: cleanQuery,
+        ...(placeType ? { type: placeType } : {}),
       };
-      if (placeType) params.type = placeType;
 
       const response = await this.client.placesNearby({
         params: params as unknown as Parameters<typeof this.client.placesNearby>[0]["params"],
@@ -259,30 +304,35 @@ class PlacesClient {
   }
 
   private processResults(results: unknown[]): PlaceResult[] {
-    return results.slice(0, 10).map((place: unknown) => {
+    const processed: PlaceResult[] = [];
+    for (const place of results) {
+      if (processed.length >= 10) break;
       const candidate = place as {
         name: string;
         place_id: string;
         types: string[];
         rating?: number;
         user_ratings_total?: number;
-        geometry: { location: { lat: number; lng: number } };
+        geometry?: { location?: { lat: number; lng: number } };
         vicinity?: string;
         formatted_address?: string;
         price_level?: number;
       };
+      const location = candidate?.geometry?.location;
+      if (!location) continue;
 
-      return {
+      processed.push({
         name: candidate.name,
         place_id: candidate.place_id,
         types: candidate.types,
         rating: candidate.rating || 0,
         user_ratings_total: candidate.user_ratings_total || 0,
-        location: candidate.geometry.location,
+        location,
         vicinity: candidate.vicinity || candidate.formatted_address || "",
         price_level: candidate.price_level,
-      };
-    });
+      });
+    }
+    return processed;
   }
 
   async getPlaceDetails(placeId: string): Promise<PlaceDetails | null> {
@@ -294,6 +344,20 @@ class PlacesClient {
       return null;
     }
 
+    // The same place (e.g. the hotel) shows up across several days; share one details request.
+    const pending = this.pendingPlaceDetails.get(placeId);
+    if (pending) {
+      return pending;
+    }
+
+    const request = this.fetchPlaceDetails(placeId).finally(() => {
+      this.pendingPlaceDetails.delete(placeId);
+    });
+    this.pendingPlaceDetails.set(placeId, request);
+    return request;
+  }
+
+  private async fetchPlaceDetails(placeId: string): Promise<PlaceDetails | null> {
     try {
       const response = await this.client.placeDetails({
         params: {
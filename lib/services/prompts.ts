@@ -9,6 +9,7 @@ import type {
   ResearchOptionPreference,
 } from "@/lib/models/travel-plan";
 import { formatTripPreferenceSummary, getTripFoodPreferences } from "@/lib/utils/trip-preferences";
+import { countTripDays } from "@/lib/services/day-grouping/utils";
 
 export const SYSTEM_PROMPTS = {
   INFO_GATHERING: `You are an expert travel planning assistant. You are in the INFO GATHERING phase.
@@ -318,17 +319,51 @@ Rules:
 - Avoid duplicates against existing option titles in context.
 - Respect destination, dates, and traveler preferences.
 - Return ONLY valid JSON.`,
+
+  AI_CHECK: `You are a principal travel-planning reviewer. Respond in plain text only. Be concise and high-signal. Focus only on the most important findings for decision-making right now. Do not recap each day or narrate the itinerary chronologically unless a critical issue depends on specific day sequencing. Prefer 3-5 short bullets total. Each bullet should be one key issue, risk, or recommendation. Avoid filler, repetition, and obvious statements. Treat provided timing/commute estimates as approximate but actionable for identifying overloaded days, long transfers, and sequencing risks. For overload judgments, prioritize totalEffectivePlannedHours over raw totalPlannedHours and treat off-hours one-off activities as discounted load. If a day clearly still has free capacity before evening, do not call it overloaded. If there are no meaningful issues, say exactly: Everything looks good.`,
+
+  DAY_GROUPING_REFINEMENT: `You are improving upon a travel itinerary that might be suboptimal in several ways, including empty days without a plan, overloaded days, too much driving, activies that can be scheduled but are not, etc. Please use your judgement to suggest some logical improvements to the itinerary using the operations and guidelines below.
+Return ONLY JSON:
+{
+  "operations": [
+    {
+      "type": "move | reorder_activities | set_night_stay | no_op",
+      "...": "operation fields"
+    }
+  ]
+}
+
+Allowed operations:
+1) move(dayNumber, activityIds, insertIndex?)
+   - Moves each activity from wherever it currently is into the target day.
+   - Use dayNumber: 0 to move activities into the Unassigned bucket.
+2) reorder_activities(dayNumber, activityIds)
+   - Reorders the activities already scheduled on that day.
+   - activityIds must be the full ordered list for that day after reordering.
+   - Do not use this to move activities between days or to/from Unassigned.
+3) set_night_stay(dayNumber, label, notes?)
+4) no_op(reason?)
+
+Rules:
+- no_op should appear only when no meaningful improvement is likely.
+- Never invent activity IDs.
+- Use activity IDs from the payload as references; names are provided only for readability.
+- Only use day numbers that exist.
+- dayNumber 0 is reserved for the Unassigned bucket.
+- Treat day timing/capacity constraints as hard feasibility signals, not optional preferences.
+- Use scheduledActivities as the authoritative current intra-day order and timing for the existing plan.
+- When only the order inside one day should change, prefer reorder_activities over move.
+- Consider intraday reordering when it can reduce commute, fix timing conflicts, or better respect fixed starts and recommended windows.
+- On an arrival day, do not move activities that would need to start before the earliestStart constraint; move them to dayNumber 0 or choose no_op if they cannot fit.
+- On a departure day, do not move activities that would need to end after the latestEnd constraint; move them to dayNumber 0 or choose no_op if they cannot fit.
+- Preserve fixed-time or narrow-window activities only when the target day can honor their time window.
+- If allowDurationShrinking is false, do not rely on shortening visit durations; keep visits near recommended durations.
+- If no likely improvement exists, return one operation: [{"type":"no_op","reason":"..."}].`,
 };
 
 function getEffectiveDurationDays(tripInfo: TripInfo): number {
-  if (tripInfo.startDate && tripInfo.endDate) {
-    const start = new Date(tripInfo.startDate);
-    const end = new Date(tripInfo.endDate);
-    if (!Number.isNaN(start.getTime()) && !Number.isNaN(end.getTime())) {
-      const derivedDays = Math.floor((end.getTime() - start.getTime()) / (1000 * 60 * 60 * 24)) + 1;
-      if (derivedDays > 0) return derivedDays;
-    }
-  }
+  const derivedDays = countTripDays(tripInfo.startDate, tripInfo.endDate);
+  if (derivedDays) return derivedDays;
 
   if (typeof tripInfo.durationDays === "number" && tripInfo.durationDays > 0) {
     return tripInfo.durationDays;
@@ -407,7 +442,7 @@ ${tripInfo.preferences.length > 0 ? `User Preferences:\n- ${tripInfo.preferences
 ${getTripFoodPreferences(tripInfo).length > 0 ? `Food Context:\n- ${getTripFoodPreferences(tripInfo).join("\n- ")}\n` : ""}
 
 Full Itinerary:
-${JSON.stringify(groupedDays, null, 2)}
+${JSON.stringify(groupedDays)}
 
 User feedback: ${userMessage}`,
   });
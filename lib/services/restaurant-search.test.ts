@@ -0,0 +1,60 @@
+import { describe, expect, it } from "vitest";
+import { getCentroid, takeDistinctCoordinates, takeUniquePlaces } from "@/lib/services/restaurant-search";
+
+describe("getCentroid", () => {
+  it("averages numeric and numeric-string coordinates", () => {
+    expect(getCentroid([{ lat: 10, lng: 20 }, { lat: "20", lng: "40" }])).toEqual({ lat: 15, lng: 30 });
+  });
+
+  it("skips coordinates without a finite lat/lng", () => {
+    expect(
+      getCentroid([
+        { lat: 10, lng: 20 },
+        { lat: null, lng: 5 },
+        { lat: "abc", lng: 5 },
+        { lat: Number.NaN, lng: 5 },
+      ])
+    ).toEqual({ lat: 10, lng: 20 });
+  });
+
+  it("falls back to the origin when nothing is usable", () => {
+    expect(getCentroid([{ lat: null, lng: null }])).toEqual({ lat: 0, lng: 0 });
+  });
+});
+
+describe("takeDistinctCoordinates", () => {
+  it("drops invalid coordinates instead of throwing and parses numeric strings", () => {
+    expect(
+      takeDistinctCoordinates(
+        [{ lat: null, lng: 1 }, { lat: "1.5", lng: "2.5" }, { lat: undefined, lng: undefined }],
+        5
+      )
+    ).toEqual([{ lat: 1.5, lng: 2.5 }]);
+  });
+
+  it("collapses nearby duplicates and respects the limit", () => {
+    const distinct = takeDistinctCoordinates(
+      [
+        { lat: 1.00001, lng: 2.00001 },
+        { lat: 1.00002, lng: 2.00002 },
+        { lat: 3, lng: 4 },
+        { lat: 5, lng: 6 },
+      ],
+      2
+    );
+    expect(distinct).toEqual([
+      { lat: 1.00001, lng: 2.00001 },
+      { lat: 3, lng: 4 },
+    ]);
+  });
+});
+
+describe("takeUniquePlaces", () => {
+  it("keeps first occurrences across groups and stops at the limit", () => {
+    const groups = [
+      [{ place_id: "a" }, { place_id: "b" }],
+      [{ place_id: "b" }, { place_id: "c" }, { place_id: "d" }],
+    ];
+    expect(takeUniquePlaces(groups, 3).map((place) => place.place_id)).toEqual(["a", "b", "c"]);
+  });
+});
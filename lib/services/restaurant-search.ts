@@ -0,0 +1,120 @@
+import type { Coordinates } from "@/lib/models/travel-plan";
+import type { getPlacesClient, PlaceResult } from "@/lib/services/places-client";
+
+// Session coordinates come from LLM and Places payloads and aren't guaranteed to be numeric.
+type CoordinateLike = {
+  lat?: number | string | null;
+  lng?: number | string | null;
+};
+
+function toFiniteNumber(value: number | string | null | undefined): number | null {
+  const parsed = typeof value === "string" ? parseFloat(value) : value;
+  return typeof parsed === "number" && Number.isFinite(parsed) ? parsed : null;
+}
+
+function toFiniteCoordinates(coord: CoordinateLike | null | undefined): Coordinates | null {
+  if (!coord) return null;
+  const lat = toFiniteNumber(coord.lat);
+  const lng = toFiniteNumber(coord.lng);
+  return lat === null || lng === null ? null : { lat, lng };
+}
+
+/**
+ * Get centroid of coordinates, skipping entries without a finite lat/lng
+ */
+export function getCentroid(coordinates: CoordinateLike[]): Coordinates {
+  // Accumulate into two numbers rather than allocating a new sum object per coordinate.
+  let latSum = 0;
+  let lngSum = 0;
+  let count = 0;
+  for (const coord of coordinates) {
+    const finite = toFiniteCoordinates(coord);
+    if (!finite) continue;
+    latSum += finite.lat;
+    lngSum += finite.lng;
+    count += 1;
+  }
+  if (count === 0) {
+    return { lat: 0, lng: 0 };
+  }
+  return {
+    lat: latSum / count,
+    lng: lngSum / count,
+  };
+}
+
+function dedupePlacesById<T extends { place_id: string }>(places: T[]): T[] {
+  const byId = new Map<string, T>();
+  for (const place of places) {
+    if (!byId.has(place.place_id)) {
+      byId.set(place.place_id, place);
+    }
+  }
+  return Array.from(byId.values());
+}
+
+/**
+ * Merge per-query result groups in order, dropping repeated place ids and stopping as soon as
+ * `limit` unique places have been collected.
+ */
+export function takeUniquePlaces<T extends { place_id: string }>(groups: T[][], limit: number): T[] {
+  const seen = new Set<string>();
+  const unique: T[] = [];
+  for (const group of groups) {
+    for (const place of group) {
+      if (seen.has(place.place_id)) continue;
+      seen.add(place.place_id);
+      unique.push(place);
+      if (unique.length >= limit) return unique;
+    }
+  }
+  return unique;
+}
+
+// Activities often share a spot (same trailhead, same hotel); search each distinct area once
+// so the per-activity fallback spends its request budget on different neighborhoods.
+export function takeDistinctCoordinates(coordinates: CoordinateLike[], limit: number): Coordinates[] {
+  const seen = new Set<string>();
+  const distinct: Coordinates[] = [];
+  for (const coord of coordinates) {
+    const finite = toFiniteCoordinates(coord);
+    if (!finite) continue;
+    const key = `${finite.lat.toFixed(4)},${finite.lng.toFixed(4)}`;
+    if (seen.has(key)) continue;
+    seen.add(key);
+    distinct.push(finite);
+    if (distinct.length >= limit) break;
+  }
+  return distinct;
+}
+
+/**
+ * Search restaurants near the trip centroid, widening to per-activity areas and then the
+ * destination name when the tighter searches come back empty.
+ */
+export async function searchRestaurantsWithFallbacks(
+  query: string,
+  allCoordinates: CoordinateLike[],
+  centroid: Coordinates,
+  destination: string | null,
+  placesClient: ReturnType<typeof getPlacesClient>,
+): Promise<PlaceResult[]> {
+  let places = await placesClient.searchPlaces(query, centroid, 3000, "restaurant");
+
+  if (places.length === 0) {
+    places = await placesClient.searchPlaces(query, centroid, 12000, "restaurant");
+  }
+
+  if (places.length === 0) {
+    const perActivityResults = await Promise.all(
+      takeDistinctCoordinates(allCoordinates, 8).map((coord) => placesClient.searchPlaces(query, coord, 6000, "restaurant"))
+    );
+    places = dedupePlacesById(perActivityResults.flat());
+  }
+
+  if (places.length === 0 && destination) {
+    places = await placesClient.searchPlaces(`${query} in ${destination}`, null, 5000, "restaurant");
+  }
+
+  return places;
+}
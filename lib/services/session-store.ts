@@ -18,6 +18,7 @@ import type { ActivityGroupingStrategy } from "@/lib/services/day-grouping/types
 import type { ActivityCostDebug } from "@/lib/services/day-grouping/scoring";
 import type { ScheduleState } from "@/lib/services/day-grouping";
 import type { LlmRefinementResult } from "@/lib/services/day-grouping-refinement";
+import { countTripDays } from "@/lib/services/day-grouping/utils";
 
 const DEFAULT_SESSION_TTL_HOURS = 24;
 const HOUR_MS = 60 * 60 * 1000;
@@ -256,15 +257,7 @@ class SessionStore {
   }
 
   private deriveDurationDaysFromDates(startDate: string | null, endDate: string | null): number | null {
-    if (!startDate || !endDate) return null;
-
-    const start = new Date(startDate);
-    const end = new Date(endDate);
-    if (Number.isNaN(start.getTime()) || Number.isNaN(end.getTime())) return null;
-
-    const days = Math.floor((end.getTime() - start.getTime()) / (1000 * 60 * 60 * 24)) + 1;
-    if (days <= 0) return null;
-    return days;
+    return countTripDays(startDate, endDate);
   }
 
   addToConversation(sessionId: string, role: "user" | "assistant", content: string): Session | null {
@@ -3,8 +3,10 @@ import { getLLMClient } from "@/lib/services/llm-client";
 
 export async function runAccommodationSearch({
   session,
+  forceRefresh = false,
 }: {
   session: Pick<Session, "tripInfo" | "suggestedActivities" | "selectedActivityIds">;
+  forceRefresh?: boolean;
 }) {
   const llmClient = getLLMClient();
   const selectedActivities = (session.suggestedActivities || []).filter((activity) =>
@@ -13,13 +15,16 @@ export async function runAccommodationSearch({
   return llmClient.searchAccommodationOffers({
     tripInfo: session.tripInfo,
     selectedActivities,
+    forceRefresh,
   });
 }
 
 export async function runFlightSearch({
   session,
+  forceRefresh = false,
 }: {
   session: Pick<Session, "tripInfo" | "suggestedActivities" | "selectedActivityIds">;
+  forceRefresh?: boolean;
 }) {
   const llmClient = getLLMClient();
   const selectedActivities = (session.suggestedActivities || []).filter((activity) =>
@@ -28,6 +33,7 @@ export async function runFlightSearch({
   return llmClient.searchFlightOffers({
     tripInfo: session.tripInfo,
     selectedActivities,
+    forceRefresh,
   });
 }
 
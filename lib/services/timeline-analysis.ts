@@ -15,6 +15,8 @@ import type {
 } from "@/lib/timeline";
 
 const MAX_PLACE_MAP_POINTS = 400;
+// 5 decimals is ~1.1m, finer than any map zoom renders; trims the map-point payload.
+const MAP_COORDINATE_SCALE = 1e5;
 const TRIP_BREAK_GAP_HOURS = 72;
 const TRIP_HOME_SETTLE_MINUTES = 240;
 const LOCAL_TRAVEL_RADIUS_KM = 80;
@@ -54,16 +56,25 @@ function toTimestamp(value: string | null): number {
   return Number.isNaN(date.getTime()) ? Number.NaN : date.getTime();
 }
 
-function compareTimelineTimes(left: string | null, right: string | null): number {
-  const leftTime = toTimestamp(left);
-  const rightTime = toTimestamp(right);
-
+function compareTimestamps(leftTime: number, rightTime: number): number {
   if (Number.isNaN(leftTime) && Number.isNaN(rightTime)) return 0;
   if (Number.isNaN(leftTime)) return 1;
   if (Number.isNaN(rightTime)) return -1;
   return leftTime - rightTime;
 }
 
+function compareTimelineTimes(left: string | null, right: string | null): number {
+  return compareTimestamps(toTimestamp(left), toTimestamp(right));
+}
+
+// Parse each item's timestamp once up front instead of twice per sort comparison.
+function sortByTimelineTime<T extends { startTime: string | null; endTime: string | null }>(items: T[]): T[] {
+  return items
+    .map((item) => ({ item, time: toTimestamp(item.startTime || item.endTime) }))
+    .sort((left, right) => compareTimestamps(left.time, right.time))
+    .map(({ item }) => item);
+}
+
 function durationHours(startTime: string | null, endTime: string | null): number {
   const start = toTimestamp(startTime);
   const end = toTimestamp(endTime);
@@ -87,8 +98,9 @@ function isDisplayableTrip(trip: TimelineTripSummary | null): trip is TimelineTr
 function formatDuration(totalMinutes: number): string {
   if (totalMinutes < 60) return `${Math.max(1, Math.round(totalMinutes))} min`;
 
-  const hours = Math.floor(totalMinutes / 60);
-  const minutes = Math.round(totalMinutes % 60);
+  const roundedMinutes = Math.round(totalMinutes);
+  const hours = Math.floor(roundedMinutes / 60);
+  const minutes = roundedMinutes % 60;
   if (hours < 24) {
     return minutes > 0 ? `${hours}h ${minutes}m` : `${hours}h`;
   }
@@ -152,6 +164,28 @@ function placeScore(place: Pick<TimelinePlaceSummary, "visitCount" | "totalDurat
   return place.visitCount * 3 + Math.min(place.totalDurationMinutes / 60, 24);
 }
 
+function homeScore(summary: Pick<TimelineCitySummary, "visitCount" | "totalDurationMinutes">): number {
+  return summary.visitCount * 4 + summary.totalDurationMinutes / 60;
+}
+
+// Single scan for the top-scoring item; ties keep the earliest, matching a stable descending sort.
+function pickHighestScoring<T>(items: Iterable<T>, score: (item: T) => number): T | null {
+  let best: T | null = null;
+  let bestScore = -Infinity;
+  for (const item of items) {
+    const value = score(item);
+    if (best === null || value > bestScore) {
+      best = item;
+      bestScore = value;
+    }
+  }
+  return best;
+}
+
+function roundMapCoordinate(value: number): number {
+  return Math.round(value * MAP_COORDINATE_SCALE) / MAP_COORDINATE_SCALE;
+}
+
 function distanceKm(lat1: number, lng1: number, lat2: number, lng2: number): number {
   const toRadians = (value: number) => (value * Math.PI) / 180;
   const earthRadiusKm = 6371;
@@ -160,7 +194,7 @@ function distanceKm(lat1: number, lng1: number, lat2: number, lng2: number): num
   const a =
     Math.sin(dLat / 2) * Math.sin(dLat / 2) +
     Math.cos(toRadians(lat1)) * Math.cos(toRadians(lat2)) * Math.sin(dLng / 2) * Math.sin(dLng / 2);
-  return earthRadiusKm * 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a));
+  return earthRadiusKm * 2 * Math.asin(Math.min(1, Math.sqrt(a)));
 }
 
 function monthLabel(value: string | null): string | null {
@@ -398,8 +432,7 @@ function buildCountrySummaries(places: TimelinePlaceSummary[]): TimelineCountryS
 
 function buildResolvedVisits(visits: TimelineVisit[], places: TimelinePlaceSummary[]): ResolvedVisit[] {
   const placeById = new Map(places.map((place) => [place.placeId, place] as const));
-  return [...visits]
-    .sort((left, right) => compareTimelineTimes(left.startTime || left.endTime, right.startTime || right.endTime))
+  return sortByTimelineTime(visits)
     .map((visit) => {
       const place = placeById.get(visit.placeId) || buildFallbackPlaceSummary(visit);
       return {
@@ -412,20 +445,8 @@ function buildResolvedVisits(visits: TimelineVisit[], places: TimelinePlaceSumma
 }
 
 function detectHomeContext(cities: TimelineCitySummary[], countries: TimelineCountrySummary[]): TripBuildContext {
-  const homeCity = [...cities].sort((left, right) => {
-    const leftScore = left.visitCount * 4 + left.totalDurationMinutes / 60;
-    const rightScore = right.visitCount * 4 + right.totalDurationMinutes / 60;
-    return rightScore - leftScore;
-  })[0] || null;
-
-  const homeCountry =
-    homeCity?.countryCode ||
-    [...countries].sort((left, right) => {
-      const leftScore = left.visitCount * 4 + left.totalDurationMinutes / 60;
-      const rightScore = right.visitCount * 4 + right.totalDurationMinutes / 60;
-      return rightScore - leftScore;
-    })[0]?.countryCode ||
-    null;
+  const homeCity = pickHighestScoring(cities, homeScore);
+  const homeCountry = homeCity?.countryCode || pickHighestScoring(countries, homeScore)?.countryCode || null;
 
   return {
     homeCityId: homeCity?.id || null,
@@ -514,9 +535,8 @@ function summarizeTrip(events: ResolvedVisit[], tripIndex: number): TimelineTrip
     placeScores.set(event.place.name, (placeScores.get(event.place.name) || 0) + weight);
   }
 
-  const dominantCityId = [...cityScores.entries()].sort((left, right) => right[1] - left[1])[0]?.[0] || null;
-  const dominantCountryId =
-    [...countryScores.entries()].sort((left, right) => right[1] - left[1])[0]?.[0] || null;
+  const dominantCityId = pickHighestScoring(cityScores.entries(), ([, score]) => score)?.[0] || null;
+  const dominantCountryId = pickHighestScoring(countryScores.entries(), ([, score]) => score)?.[0] || null;
 
   const dominantCityEvent =
     (dominantCityId ? anchorEvents.find((event) => event.cityId === dominantCityId) : null) ||
@@ -632,7 +652,7 @@ function buildTrips(
 
   flushTrip();
 
-  return trips.sort((left, right) => compareTimelineTimes(left.startTime || left.endTime, right.startTime || right.endTime));
+  return sortByTimelineTime(trips);
 }
 
 function applyTripCounts(
@@ -761,8 +781,8 @@ function buildMapPoints(
 ): TimelineAnalysisResponse["mapPoints"] {
   const placePoints: TimelineMapPoint[] = places.slice(0, MAX_PLACE_MAP_POINTS).map((place) => ({
     id: place.placeId,
-    lat: place.lat,
-    lng: place.lng,
+    lat: roundMapCoordinate(place.lat),
+    lng: roundMapCoordinate(place.lng),
     name: place.name,
     kind: "place",
     description: [
@@ -779,8 +799,8 @@ function buildMapPoints(
 
   const cityPoints: TimelineMapPoint[] = cities.map((city) => ({
     id: city.id,
-    lat: city.lat,
-    lng: city.lng,
+    lat: roundMapCoordinate(city.lat),
+    lng: roundMapCoordinate(city.lng),
     name: city.region ? `${city.city}, ${city.region}` : city.city,
     kind: "city",
     description: [
@@ -799,8 +819,8 @@ function buildMapPoints(
 
   const countryPoints: TimelineMapPoint[] = countries.map((country) => ({
     id: country.id,
-    lat: country.lat,
-    lng: country.lng,
+    lat: roundMapCoordinate(country.lat),
+    lng: roundMapCoordinate(country.lng),
     name: country.country,
     kind: "country",
     description: [
@@ -816,8 +836,8 @@ function buildMapPoints(
 
   const tripPoints: TimelineMapPoint[] = trips.map((trip) => ({
     id: trip.id,
-    lat: trip.lat,
-    lng: trip.lng,
+    lat: roundMapCoordinate(trip.lat),
+    lng: roundMapCoordinate(trip.lng),
     name: trip.label,
     kind: "trip",
     description: [
@@ -934,14 +954,13 @@ function buildSummary(
 }
 
 export async function analyzeTimelineVisits(visits: TimelineVisit[]): Promise<TimelineAnalysisResponse> {
-  const normalizedVisits = visits
+  const normalizedVisits = sortByTimelineTime(visits
     .filter((visit) =>
       Number.isFinite(visit.lat) &&
       Number.isFinite(visit.lng) &&
       typeof visit.placeId === "string" &&
       visit.placeId.trim()
-    )
-    .sort((left, right) => compareTimelineTimes(left.startTime || left.endTime, right.startTime || right.endTime));
+    ));
 
   if (normalizedVisits.length === 0) {
     return {
@@ -14,6 +14,8 @@ import {
 
 export type TimelinePlaceInfo = CachedPlaceInfo;
 
+const TIMELINE_PLACE_LOOKUP_CONCURRENCY = 8;
+
 async function buildTimelinePlaceInfo(
   placeId: string,
   fallbackCoordinates: { lat: number; lng: number },
@@ -113,19 +115,20 @@ export async function resolveTimelinePlaceInfoMap(
   const uniquePlaces = Array.from(new Map(places.map((place) => [place.placeId, place] as const)).values());
   const resolved = new Map<string, TimelinePlaceInfo | null>();
 
-  for (let index = 0; index < uniquePlaces.length; index += 8) {
-    const batch = uniquePlaces.slice(index, index + 8);
-    const results = await Promise.all(
-      batch.map(async (place) => [
-        place.placeId,
-        await resolveTimelinePlaceInfo(place.placeId, { lat: place.lat, lng: place.lng }),
-      ] as const),
-    );
-
-    results.forEach(([placeId, info]) => {
-      resolved.set(placeId, info);
-    });
-  }
+  // Keep up to 8 lookups in flight; each worker pulls the next place as soon as it finishes,
+  // so one slow Places call no longer holds back a whole batch.
+  let nextIndex = 0;
+  const worker = async () => {
+    while (nextIndex < uniquePlaces.length) {
+      const place = uniquePlaces[nextIndex];
+      nextIndex += 1;
+      resolved.set(place.placeId, await resolveTimelinePlaceInfo(place.placeId, { lat: place.lat, lng: place.lng }));
+    }
+  };
+
+  await Promise.all(
+    Array.from({ length: Math.min(TIMELINE_PLACE_LOOKUP_CONCURRENCY, uniquePlaces.length) }, () => worker()),
+  );
 
   return resolved;
 }
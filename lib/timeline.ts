@@ -151,6 +151,9 @@ export interface TimelineAnalysisResponse {
 
 type UnknownRecord = Record<string, unknown>;
 
+const EPOCH_MILLIS_PATTERN = /^\d+$/;
+const GEO_URI_PATTERN = /^geo:([-\d.]+),([-\d.]+)$/i;
+
 function isRecord(value: unknown): value is UnknownRecord {
   return typeof value === "object" && value !== null;
 }
@@ -171,7 +174,7 @@ function toNonEmptyString(value: unknown): string | null {
 function toIsoString(value: unknown): string | null {
   if (typeof value === "string" && value.trim()) {
     const trimmed = value.trim();
-    if (/^\d+$/.test(trimmed)) {
+    if (EPOCH_MILLIS_PATTERN.test(trimmed)) {
       const parsed = Number(trimmed);
       const date = new Date(parsed);
       return Number.isNaN(date.getTime()) ? null : date.toISOString();
@@ -188,7 +191,7 @@ function toIsoString(value: unknown): string | null {
 function parseCoordinatePair(value: unknown): { lat: number; lng: number } | null {
   if (typeof value !== "string") return null;
 
-  const match = value.match(/^geo:([-\d.]+),([-\d.]+)$/i);
+  const match = GEO_URI_PATTERN.exec(value);
   if (!match) return null;
 
   const lat = Number(match[1]);
@@ -249,26 +252,22 @@ function buildTimelineVisit(entry: UnknownRecord): TimelineVisit | null {
   };
 }
 
-function getTimelineEntries(payload: unknown): UnknownRecord[] {
-  if (Array.isArray(payload)) {
-    return payload.filter(isRecord);
-  }
-
+function getTimelineEntries(payload: unknown): unknown[] {
+  if (Array.isArray(payload)) return payload;
   if (!isRecord(payload)) return [];
-
-  if (Array.isArray(payload.timelineObjects)) {
-    return payload.timelineObjects.filter(isRecord);
-  }
-
-  if (Array.isArray(payload.semanticSegments)) {
-    return payload.semanticSegments.filter(isRecord);
-  }
-
+  if (Array.isArray(payload.timelineObjects)) return payload.timelineObjects;
+  if (Array.isArray(payload.semanticSegments)) return payload.semanticSegments;
   return [];
 }
 
+// Timeline exports can hold tens of thousands of segments, so walk them once
+// without building intermediate filtered/mapped arrays.
 export function extractTimelineVisits(payload: unknown): TimelineVisit[] {
-  return getTimelineEntries(payload)
-    .map((entry) => buildTimelineVisit(entry))
-    .filter((visit): visit is TimelineVisit => Boolean(visit));
+  const visits: TimelineVisit[] = [];
+  for (const entry of getTimelineEntries(payload)) {
+    if (!isRecord(entry)) continue;
+    const visit = buildTimelineVisit(entry);
+    if (visit) visits.push(visit);
+  }
+  return visits;
 }
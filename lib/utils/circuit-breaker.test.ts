@@ -0,0 +1,64 @@
+import { describe, expect, it } from "vitest";
+import {
+  createCircuitBreakerState,
+  recordCircuitFailure,
+  recordCircuitSuccess,
+  releaseCircuitProbe,
+  tryEnterCircuit,
+} from "@/lib/utils/circuit-breaker";
+
+const options = { failureThreshold: 3, cooldownMs: 1000 };
+
+function tripCircuit(now: number) {
+  const state = createCircuitBreakerState();
+  for (let i = 0; i < options.failureThreshold; i += 1) {
+    expect(tryEnterCircuit(state, options, now)).toBe(true);
+    recordCircuitFailure(state, options, now);
+  }
+  return state;
+}
+
+describe("circuit breaker", () => {
+  it("stays closed below the failure threshold", () => {
+    const state = createCircuitBreakerState();
+    recordCircuitFailure(state, options, 0);
+    recordCircuitFailure(state, options, 0);
+    expect(tryEnterCircuit(state, options, 0)).toBe(true);
+  });
+
+  it("opens after repeated failures and rejects requests during the cooldown", () => {
+    const state = tripCircuit(0);
+    expect(tryEnterCircuit(state, options, 500)).toBe(false);
+    expect(tryEnterCircuit(state, options, 999)).toBe(false);
+  });
+
+  it("lets a single probe through after the cooldown", () => {
+    const state = tripCircuit(0);
+    expect(tryEnterCircuit(state, options, 1000)).toBe(true);
+    expect(tryEnterCircuit(state, options, 1000)).toBe(false);
+  });
+
+  it("re-opens immediately when the probe fails", () => {
+    const state = tripCircuit(0);
+    expect(tryEnterCircuit(state, options, 1000)).toBe(true);
+    recordCircuitFailure(state, options, 1000);
+    expect(tryEnterCircuit(state, options, 1500)).toBe(false);
+    expect(tryEnterCircuit(state, options, 2000)).toBe(true);
+  });
+
+  it("closes fully when the probe succeeds", () => {
+    const state = tripCircuit(0);
+    expect(tryEnterCircuit(state, options, 1000)).toBe(true);
+    recordCircuitSuccess(state);
+    expect(tryEnterCircuit(state, options, 1000)).toBe(true);
+    expect(tryEnterCircuit(state, options, 1000)).toBe(true);
+  });
+
+  it("frees the probe slot without counting a failure on release", () => {
+    const state = tripCircuit(0);
+    expect(tryEnterCircuit(state, options, 1000)).toBe(true);
+    releaseCircuitProbe(state);
+    expect(state.failures).toBe(options.failureThreshold);
+    expect(tryEnterCircuit(state, options, 1000)).toBe(true);
+  });
+});
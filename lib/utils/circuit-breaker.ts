@@ -0,0 +1,60 @@
+export interface CircuitBreakerOptions {
+  failureThreshold: number;
+  cooldownMs: number;
+}
+
+export interface CircuitBreakerState {
+  failures: number;
+  openUntil: number;
+  probeInFlight: boolean;
+}
+
+export function createCircuitBreakerState(): CircuitBreakerState {
+  return { failures: 0, openUntil: 0, probeInFlight: false };
+}
+
+/**
+ * Decide whether a request may go through. Below the failure threshold the circuit is
+ * closed. Once tripped it stays open until the cooldown ends, then lets a single probe
+ * through (half-open) and rejects everything else until that probe reports back.
+ */
+export function tryEnterCircuit(
+  state: CircuitBreakerState,
+  options: CircuitBreakerOptions,
+  now = Date.now()
+): boolean {
+  if (state.failures < options.failureThreshold) return true;
+  if (now < state.openUntil || state.probeInFlight) return false;
+  state.probeInFlight = true;
+  return true;
+}
+
+export function recordCircuitSuccess(state: CircuitBreakerState): void {
+  state.failures = 0;
+  state.openUntil = 0;
+  state.probeInFlight = false;
+}
+
+/**
+ * Count an outage. The failure count is kept after tripping, so a failed half-open probe
+ * re-opens the circuit immediately instead of needing a fresh run of failures.
+ */
+export function recordCircuitFailure(
+  state: CircuitBreakerState,
+  options: CircuitBreakerOptions,
+  now = Date.now()
+): void {
+  state.failures += 1;
+  state.probeInFlight = false;
+  if (state.failures >= options.failureThreshold) {
+    state.openUntil = now + options.cooldownMs;
+  }
+}
+
+/**
+ * Finish a request whose failure says nothing about service health (e.g. a malformed
+ * response). Leaves the failure count alone and frees the half-open probe slot.
+ */
+export function releaseCircuitProbe(state: CircuitBreakerState): void {
+  state.probeInFlight = false;
+}
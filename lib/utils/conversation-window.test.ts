@@ -0,0 +1,26 @@
+import { describe, expect, it } from "vitest";
+import { takeRecentConversation } from "@/lib/utils/conversation-window";
+
+const message = (content: string) => ({ role: "user" as const, content });
+
+describe("takeRecentConversation", () => {
+  it("keeps at most the requested number of recent messages", () => {
+    const history = ["a", "b", "c", "d"].map(message);
+    expect(takeRecentConversation(history, 2).map((entry) => entry.content)).toEqual(["c", "d"]);
+  });
+
+  it("drops older messages once the character budget is exhausted", () => {
+    const history = [message("x".repeat(50)), message("y".repeat(30)), message("z".repeat(30))];
+    const recent = takeRecentConversation(history, 10, 70);
+    expect(recent.map((entry) => entry.content[0])).toEqual(["y", "z"]);
+  });
+
+  it("always keeps the newest message even when it exceeds the budget", () => {
+    const history = [message("short"), message("x".repeat(200))];
+    expect(takeRecentConversation(history, 5, 100)).toHaveLength(1);
+  });
+
+  it("returns an empty list for missing history", () => {
+    expect(takeRecentConversation(undefined, 5)).toEqual([]);
+  });
+});
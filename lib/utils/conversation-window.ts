@@ -0,0 +1,37 @@
+type ConversationEntry = {
+  content: string;
+};
+
+// Rough character budget for recent chat history sent alongside the plan context.
+// ~4 characters per token keeps this near 3K tokens without needing a tokenizer.
+export const DEFAULT_CONVERSATION_CHAR_BUDGET = 12000;
+
+/**
+ * Walk back from the newest message until either the message cap or the character budget
+ * is reached, and return the kept messages in their original (chronological) order. The
+ * newest message is always kept so the model sees the latest turn even when it alone
+ * exceeds the budget.
+ */
+export function takeRecentConversation<T extends ConversationEntry>(
+  messages: T[] | null | undefined,
+  maxMessages: number,
+  maxChars = DEFAULT_CONVERSATION_CHAR_BUDGET
+): T[] {
+  if (!messages || messages.length === 0 || maxMessages <= 0) {
+    return [];
+  }
+
+  let start = messages.length;
+  let usedChars = 0;
+  const minStart = Math.max(0, messages.length - maxMessages);
+
+  while (start > minStart) {
+    const content = messages[start - 1].content;
+    const length = typeof content === "string" ? content.length : 0;
+    if (start < messages.length && usedChars + length > maxChars) break;
+    usedChars += length;
+    start -= 1;
+  }
+
+  return messages.slice(start);
+}
@@ -1,6 +1,6 @@
 import { describe, expect, it } from "vitest";
 import type { SuggestedActivity } from "@/lib/api-client";
-import { hasHardFixedStart } from "@/lib/utils/timeline-utils";
+import { earliestMinutes, hasHardFixedStart } from "@/lib/utils/timeline-utils";
 
 const activity = (overrides: Partial<SuggestedActivity>): SuggestedActivity =>
   ({
@@ -67,3 +67,13 @@ describe("hasHardFixedStart", () => {
     ).toBe(false);
   });
 });
+
+describe("earliestMinutes", () => {
+  it("returns the smallest non-null value", () => {
+    expect(earliestMinutes([540, null, 420, 600], (value) => value)).toBe(420);
+  });
+
+  it("returns undefined when no item has a value", () => {
+    expect(earliestMinutes([null, null], (value) => value)).toBeUndefined();
+  });
+});
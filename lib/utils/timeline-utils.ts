@@ -136,7 +136,7 @@ export function haversineKm(
     const a =
         Math.sin(dLat / 2) * Math.sin(dLat / 2) +
         Math.cos(toRad(from.lat)) * Math.cos(toRad(to.lat)) * Math.sin(dLng / 2) * Math.sin(dLng / 2);
-    const c = 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a));
+    const c = 2 * Math.asin(Math.min(1, Math.sqrt(a)));
     return R * c;
 }
 
@@ -283,6 +283,21 @@ export function commuteModeLabel(mode: CommuteMode): string {
 // Activity-timing helpers
 // ---------------------------------------------------------------------------
 
+/**
+ * Return the smallest non-null minutes value produced for the items, or undefined when
+ * none has one. Scans once instead of filtering and sorting just to read the first entry.
+ */
+export function earliestMinutes<T>(items: T[], getMinutes: (item: T) => number | null): number | undefined {
+    let earliest: number | undefined;
+    for (const item of items) {
+        const minutes = getMinutes(item);
+        if (minutes != null && (earliest === undefined || minutes < earliest)) {
+            earliest = minutes;
+        }
+    }
+    return earliest;
+}
+
 /**
  * Return the midpoint of the activity's recommended start window in
  * minutes-since-midnight, or null if no window is defined.